@@ -1,12 +1,17 @@
 import streamlit as st
 import pandas as pd
-import pickle
 import base64
+import uuid
 from io import BytesIO
 from PIL import Image
 import requests
 from report_generator import generate_report
 from diet_recommendations import get_diet_recommendations
+from model import predict_heart_disease
+from profiling import profile_render, profiled
+from traffic import record_event
+from validation import validate_record, CHEST_PAIN_TYPES
+from report_queue import get_report_queue, QueueFullError, DONE, FAILED
 
 # Set page configuration
 st.set_page_config(
@@ -22,30 +27,104 @@ if 'prediction' not in st.session_state:
     st.session_state.prediction = None
 if 'user_data' not in st.session_state:
     st.session_state.user_data = {}
+if 'session_id' not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+if 'report_jobs' not in st.session_state:
+    st.session_state.report_jobs = {}
 
 # Function to navigate between pages
 def navigate_to(page):
+    record_event('navigate', st.session_state.session_id, page=page, prediction=st.session_state.prediction)
     st.session_state.page = page
     st.rerun()
 
-# Heart disease prediction function
-def predict_heart_disease(user_data):
-    # Load the model
-    with open('heart_disease_model.pkl', 'rb') as file:
-        model = pickle.load(file)
-    
-    # Create a DataFrame from user data
-    input_df = pd.DataFrame([{
-        'age': user_data['age'],
-        'sex': 1 if user_data['gender'] == 'Male' else 0,
-        'cp': int(user_data['chest_pain_type']),
-        'trestbps': user_data['blood_pressure'],
-        'chol': user_data['cholesterol']
-    }])
-    
-    # Make prediction
-    prediction = model.predict(input_df)[0]
-    return bool(prediction)
+# Profile the expensive calls when HEART_PROFILE is set (no-op otherwise)
+predict_heart_disease = profiled("predict_heart_disease")(predict_heart_disease)
+generate_report = profiled("generate_report")(generate_report)
+
+# Queue a background PDF report job for the current user
+def submit_report_job(job_key, recommendations):
+    record_event(
+        'report',
+        st.session_state.session_id,
+        user_data=st.session_state.user_data,
+        prediction=st.session_state.prediction
+    )
+    report_queue = get_report_queue()
+    previous_job = st.session_state.report_jobs.pop(job_key, None)
+    if previous_job is not None:
+        report_queue.discard(previous_job)
+    try:
+        st.session_state.report_jobs[job_key] = report_queue.submit(
+            generate_report,
+            dict(st.session_state.user_data),
+            st.session_state.prediction,
+            recommendations,
+            session_id=st.session_state.session_id
+        )
+    except QueueFullError as exc:
+        st.error(str(exc))
+
+# Show progress of a pending report job, polling until it finishes
+@st.fragment(run_every=1)
+def poll_report_job(job_key):
+    status = get_report_queue().status(st.session_state.report_jobs[job_key])
+    if status is None or status['status'] in (DONE, FAILED):
+        st.rerun()
+    st.progress(status['progress'], text="Generating your report...")
+
+# Show the download button (or status) for a report job
+def show_report_job(job_key):
+    job_id = st.session_state.report_jobs.get(job_key)
+    if job_id is None:
+        return
+    # Status and report bytes are read together so the job cannot be evicted in between
+    status = get_report_queue().snapshot(job_id)
+    if status is None:
+        del st.session_state.report_jobs[job_key]
+    elif status['status'] == DONE:
+        st.download_button(
+            "Download Report",
+            data=status['result'],
+            file_name="heart_health_report.pdf",
+            mime="application/pdf",
+            key=f"{job_key}_download"
+        )
+    elif status['status'] == FAILED:
+        st.error(f"Report generation failed: {status['error']}")
+    else:
+        poll_report_job(job_key)
+
+# Discard all report jobs belonging to this session
+def clear_report_jobs():
+    report_queue = get_report_queue()
+    for job_id in st.session_state.report_jobs.values():
+        report_queue.discard(job_id)
+    st.session_state.report_jobs = {}
+
+# Build the recommendation cards' markdown once per recommendation set
+@st.cache_data
+def recommendation_blocks(content_hash, _recommendations):
+    food_icons = ["🥗", "🥦", "🍎", "🥑", "🐟", "🫐", "🍗", "🍚", "🥛", "🌰"]
+    blocks = []
+    
+    for i, (section, items) in enumerate(_recommendations.items()):
+        blocks.append(f"""
+        <div class="food-card">
+            <div class="section-header">{section}</div>
+        """)
+        
+        for j, item in enumerate(items):
+            icon = food_icons[(i + j) % len(food_icons)]
+            blocks.append(f"""
+            <div class="food-item">
+                <div class="food-icon">{icon}</div>
+                <div class="food-text">{item}</div>
+            </div>
+            """)
+        
+        blocks.append("</div>")
+    return blocks
 
 # Function to get image as base64
 def get_image_base64(image_url):
@@ -68,105 +147,98 @@ food_images = [
     "https://pixabay.com/get/gbb3a9e8c212b50949c80292c570f0044e3f11a28617b63cfd5191b5c34ce639636995dd06ab1b8a3b941392253f5064b650b8d2809a7e850f98ea7f04aa09e30_1280.jpg"
 ]
 
-# HOME PAGE
-if st.session_state.page == 'home':
-    # Apply custom CSS for social media-like interface
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #f0f2f6;
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-    }
-    .css-18e3th9 {
-        padding-top: 0rem;
-        padding-bottom: 10rem;
-        padding-left: 5rem;
-        padding-right: 5rem;
-    }
-    .css-1d391kg {
-        padding-top: 3.5rem;
-        padding-right: 1rem;
-        padding-bottom: 3.5rem;
-        padding-left: 1rem;
-    }
-    .st-bq {
-        background-color: #ffffff;
-        border-radius: 10px;
-        padding: 20px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    .header-style {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #ff4b4b;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .subheader-style {
-        font-size: 1.2rem;
-        font-weight: 500;
-        color: #4a4a4a;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # App header in social media style
-    st.markdown("<div class='header-style'>Early Heart Attack Prediction</div>", unsafe_allow_html=True)
-    st.markdown("<div class='subheader-style'>Know your heart health status instantly</div>", unsafe_allow_html=True)
-    
-    # Display large heart image at the top
-    col1, col2, col3 = st.columns([1, 3, 1])
-    with col2:
-        st.image(heart_image_2, use_container_width=True)
-    
-    # Information and form section
-    st.markdown("---")
-    st.markdown("<h3 style='text-align: center; color: #262730;'>Complete Your Health Assessment</h3>", unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Card-like container for the welcome message
+# Render the current page, profiling memory and CPU per render when HEART_PROFILE is set
+with profile_render(f"page_{st.session_state.page}"):
+    # HOME PAGE
+    if st.session_state.page == 'home':
+        # Apply custom CSS for social media-like interface
         st.markdown("""
-        <div style="background-color: white; padding: 20px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-        <h4 style="color: #262730;">Welcome!</h4>
-        <p>This application helps assess your risk of heart disease based on various health parameters.
-        Please provide your details below for an accurate assessment.</p>
-        </div>
+        <style>
+        .main {
+            background-color: #f0f2f6;
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+        }
+        .css-18e3th9 {
+            padding-top: 0rem;
+            padding-bottom: 10rem;
+            padding-left: 5rem;
+            padding-right: 5rem;
+        }
+        .css-1d391kg {
+            padding-top: 3.5rem;
+            padding-right: 1rem;
+            padding-bottom: 3.5rem;
+            padding-left: 1rem;
+        }
+        .st-bq {
+            background-color: #ffffff;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header-style {
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: #ff4b4b;
+            text-align: center;
+            margin-bottom: 1rem;
+        }
+        .subheader-style {
+            font-size: 1.2rem;
+            font-weight: 500;
+            color: #4a4a4a;
+            text-align: center;
+            margin-bottom: 2rem;
+        }
+        </style>
         """, unsafe_allow_html=True)
+    
+        # App header in social media style
+        st.markdown("<div class='header-style'>Early Heart Attack Prediction</div>", unsafe_allow_html=True)
+        st.markdown("<div class='subheader-style'>Know your heart health status instantly</div>", unsafe_allow_html=True)
+    
+        # Display large heart image at the top
+        col1, col2, col3 = st.columns([1, 3, 1])
+        with col2:
+            st.image(heart_image_2, use_container_width=True)
+    
+        # Information and form section
+        st.markdown("---")
+        st.markdown("<h3 style='text-align: center; color: #262730;'>Complete Your Health Assessment</h3>", unsafe_allow_html=True)
+    
+        col1, col2 = st.columns([2, 1])
+    
+        with col1:
+            # Card-like container for the welcome message
+            st.markdown("""
+            <div style="background-color: white; padding: 20px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <h4 style="color: #262730;">Welcome!</h4>
+            <p>This application helps assess your risk of heart disease based on various health parameters.
+            Please provide your details below for an accurate assessment.</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        # Display form to collect user data in a card-like container
-        with st.form("user_data_form"):
-            name = st.text_input("Name")
-            age = st.number_input("Age", min_value=18, max_value=100, step=1)
-            gender = st.selectbox("Gender", ["Male", "Female"])
-            blood_pressure = st.number_input("Blood Pressure (mmHg)", min_value=90, max_value=200, step=1)
-            cholesterol = st.number_input("Cholesterol (mg/dL)", min_value=100, max_value=500, step=1)
+            # Display form to collect user data in a card-like container
+            with st.form("user_data_form"):
+                name = st.text_input("Name")
+                age = st.number_input("Age", min_value=18, max_value=100, step=1)
+                gender = st.selectbox("Gender", ["Male", "Female"])
+                blood_pressure = st.number_input("Blood Pressure (mmHg)", min_value=90, max_value=200, step=1)
+                cholesterol = st.number_input("Cholesterol (mg/dL)", min_value=100, max_value=500, step=1)
             
-            # Chest pain type with descriptions
-            chest_pain_options = {
-                "0": "No Pain (0)",
-                "1": "Typical Angina (1)",
-                "2": "Atypical Angina (2)",
-                "3": "Non-anginal Pain (3)"
-            }
-            chest_pain_type = st.selectbox(
-                "Chest Pain Type", 
-                list(chest_pain_options.values())
-            )
-            # Extract the numeric value from the selected option
-            chest_pain_type = chest_pain_type.split('(')[1].split(')')[0]
+                # Chest pain type with descriptions
+                chest_pain_options = [
+                    f"{label} ({code})" for code, label in CHEST_PAIN_TYPES.items()
+                ]
+                chest_pain_type = st.selectbox(
+                    "Chest Pain Type", 
+                    chest_pain_options
+                )
             
-            submit_button = st.form_submit_button("Check Heart Disease Risk")
+                submit_button = st.form_submit_button("Check Heart Disease Risk")
             
-            if submit_button:
-                if not name or age < 18 or not blood_pressure or not cholesterol:
-                    st.error("Please fill all the fields with valid values.")
-                else:
-                    # Store user data in session state
-                    st.session_state.user_data = {
+                if submit_button:
+                    form_data = {
                         'name': name,
                         'age': age,
                         'gender': gender,
@@ -174,367 +246,353 @@ if st.session_state.page == 'home':
                         'cholesterol': cholesterol,
                         'chest_pain_type': chest_pain_type
                     }
+                    record_event('submit', st.session_state.session_id, form=form_data)
                     
-                    # Make prediction
-                    prediction = predict_heart_disease(st.session_state.user_data)
-                    st.session_state.prediction = prediction
+                    # Validate and normalize the form values (also parses the chest pain label)
+                    user_data, errors = validate_record(form_data)
+                    if errors:
+                        st.error("Please fill all the fields with valid values.\n\n" + "\n".join(f"- {error}" for error in errors))
+                    else:
+                        # Store user data in session state
+                        st.session_state.user_data = user_data
                     
-                    # Navigate to results page
-                    navigate_to('results')
+                        # Make prediction
+                        prediction = predict_heart_disease(st.session_state.user_data)
+                        st.session_state.prediction = prediction
+                    
+                        # Navigate to results page
+                        navigate_to('results')
     
-    with col2:
-        # Display heart image with card-like styling
-        st.markdown("""
-        <div style="background-color: white; padding: 10px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-        """, unsafe_allow_html=True)
-        st.image(heart_image_1, use_container_width=True)
-        st.markdown("""
-        <div style="text-align: center; font-style: italic; font-size: 0.9rem;">
-            Keep your heart healthy with regular checkups
-        </div>
-        </div>
-        """, unsafe_allow_html=True)
+        with col2:
+            # Display heart image with card-like styling
+            st.markdown("""
+            <div style="background-color: white; padding: 10px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            """, unsafe_allow_html=True)
+            st.image(heart_image_1, use_container_width=True)
+            st.markdown("""
+            <div style="text-align: center; font-style: italic; font-size: 0.9rem;">
+                Keep your heart healthy with regular checkups
+            </div>
+            </div>
+            """, unsafe_allow_html=True)
 
-# RESULTS PAGE
-elif st.session_state.page == 'results':
-    # Apply custom CSS for social media-like interface
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #f0f2f6;
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-    }
-    .card {
-        background-color: white;
-        border-radius: 10px;
-        padding: 20px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        margin-bottom: 20px;
-    }
-    .user-info {
-        display: flex;
-        align-items: center;
-        margin-bottom: 15px;
-    }
-    .user-icon {
-        background-color: #e0e0ef;
-        border-radius: 50%;
-        width: 50px;
-        height: 50px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        margin-right: 15px;
-        font-size: 20px;
-        font-weight: bold;
-    }
-    .user-name {
-        font-weight: bold;
-        font-size: 1.2rem;
-    }
-    .timestamp {
-        color: #888;
-        font-size: 0.8rem;
-    }
-    .button-container {
-        display: flex;
-        justify-content: space-between;
-        margin-top: 20px;
-    }
-    .action-button {
-        border-radius: 20px;
-        padding: 8px 16px;
-        font-weight: 500;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Apply different styling based on prediction
-    if st.session_state.prediction:
-        header_color = "#FF0000"
-        background_color = "#FFEEEE"
-        header_text = "Heart Disease Detected"
-        card_border = "border-left: 4px solid #FF0000;"
-        emoji = "⚠️"
-    else:
-        header_color = "#00AA00"
-        background_color = "#EEFFEE"
-        header_text = "No Heart Disease Detected"
-        card_border = "border-left: 4px solid #00AA00;"
-        emoji = "✅"
-    
-    # Create header with notification-style
-    st.markdown(f"""
-    <div style="text-align: center; margin-bottom: 30px;">
-        <div style="font-size: 2.5rem; font-weight: bold; color: {header_color};">{header_text}</div>
-        <div style="font-size: 1.2rem; color: #4a4a4a;">Assessment completed on {pd.Timestamp.now().strftime('%B %d, %Y')}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Create a card for user information with normal readable text
-    # First create the card container
-    st.markdown(f"""
-    <div class="card" style="{card_border}">
-    """, unsafe_allow_html=True)
-    
-    # Add user profile header
-    st.subheader(f"{st.session_state.user_data['name']}'s Health Profile")
-    
-    # Add assessment result
-    st.markdown(f"""
-    <div style="padding: 15px; background-color: {background_color}; border-radius: 8px; margin: 15px 0;">
-        <span style="font-size: 1.3rem; font-weight: 500;">{emoji} {header_text}</span>
-        <p style="margin-top: 10px;">
-            Based on your provided health information, our assessment shows 
-            {'indicators of heart disease risk factors' if st.session_state.prediction else 'no significant indicators of heart disease'}.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Display user information in a clean format
-    st.write("### Your Health Information")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write(f"**Age:** {st.session_state.user_data['age']} years")
-        st.write(f"**Gender:** {st.session_state.user_data['gender']}")
-        st.write(f"**Chest Pain Type:** Type {st.session_state.user_data['chest_pain_type']}")
-    
-    with col2:
-        st.write(f"**Blood Pressure:** {st.session_state.user_data['blood_pressure']} mmHg")
-        st.write(f"**Cholesterol:** {st.session_state.user_data['cholesterol']} mg/dL")
-    
-    # Close the card div
-    st.markdown("</div>", unsafe_allow_html=True)
-    
-    # Create action buttons in a social media style
-    col1, col2, col3 = st.columns([1, 1, 1])
-    
-    with col1:
+    # RESULTS PAGE
+    elif st.session_state.page == 'results':
+        # Apply custom CSS for social media-like interface
         st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">🥗</div>
-            <div style="font-weight: 500; margin-bottom: 5px;">Diet Plan</div>
-        </div>
+        <style>
+        .main {
+            background-color: #f0f2f6;
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+        }
+        .card {
+            background-color: white;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            margin-bottom: 20px;
+        }
+        .user-info {
+            display: flex;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+        .user-icon {
+            background-color: #e0e0ef;
+            border-radius: 50%;
+            width: 50px;
+            height: 50px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-right: 15px;
+            font-size: 20px;
+            font-weight: bold;
+        }
+        .user-name {
+            font-weight: bold;
+            font-size: 1.2rem;
+        }
+        .timestamp {
+            color: #888;
+            font-size: 0.8rem;
+        }
+        .button-container {
+            display: flex;
+            justify-content: space-between;
+            margin-top: 20px;
+        }
+        .action-button {
+            border-radius: 20px;
+            padding: 8px 16px;
+            font-weight: 500;
+        }
+        </style>
         """, unsafe_allow_html=True)
-        if st.button("View Recommendations", key="diet_button"):
-            navigate_to('diet')
     
-    with col2:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">📋</div>
-            <div style="font-weight: 500; margin-bottom: 5px;">Health Report</div>
+        # Apply different styling based on prediction
+        if st.session_state.prediction:
+            header_color = "#FF0000"
+            background_color = "#FFEEEE"
+            header_text = "Heart Disease Detected"
+            card_border = "border-left: 4px solid #FF0000;"
+            emoji = "⚠️"
+        else:
+            header_color = "#00AA00"
+            background_color = "#EEFFEE"
+            header_text = "No Heart Disease Detected"
+            card_border = "border-left: 4px solid #00AA00;"
+            emoji = "✅"
+    
+        # Create header with notification-style
+        st.markdown(f"""
+        <div style="text-align: center; margin-bottom: 30px;">
+            <div style="font-size: 2.5rem; font-weight: bold; color: {header_color};">{header_text}</div>
+            <div style="font-size: 1.2rem; color: #4a4a4a;">Assessment completed on {pd.Timestamp.now().strftime('%B %d, %Y')}</div>
         </div>
         """, unsafe_allow_html=True)
-        if st.button("Download PDF", key="report_button"):
-            report = generate_report(
-                st.session_state.user_data,
-                st.session_state.prediction,
-                get_diet_recommendations(st.session_state.prediction)
-            )
-            
-            # Create download button for the PDF
-            b64_pdf = base64.b64encode(report).decode('utf-8')
-            href = f'<a href="data:application/pdf;base64,{b64_pdf}" download="heart_health_report.pdf" style="text-decoration: none;"><div style="text-align: center; background-color: #f0f0f0; padding: 8px; border-radius: 5px; color: #333; font-weight: 500;">Download Report</div></a>'
-            st.markdown(href, unsafe_allow_html=True)
     
-    with col3:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">🏠</div>
-            <div style="font-weight: 500; margin-bottom: 5px;">New Assessment</div>
-        </div>
+        # Create a card for user information with normal readable text
+        # First create the card container
+        st.markdown(f"""
+        <div class="card" style="{card_border}">
         """, unsafe_allow_html=True)
-        if st.button("Start Over", key="home_button"):
-            # Reset session state
-            st.session_state.prediction = None
-            st.session_state.user_data = {}
-            navigate_to('home')
-            
-    # Add disclaimer at the bottom
-    st.markdown("""
-    <div style="margin-top: 30px; padding: 15px; background-color: #f8f9fa; border-radius: 10px; font-size: 0.9rem; color: #666;">
-        <strong>Disclaimer:</strong> This assessment is for informational purposes only and is not a substitute for professional medical advice. 
-        Please consult with a healthcare provider for proper diagnosis and treatment.
-    </div>
-    """, unsafe_allow_html=True)
-
-# DIET RECOMMENDATIONS PAGE
-elif st.session_state.page == 'diet':
-    # Apply custom CSS for social media-like interface
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #f0f2f6;
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-    }
-    .food-card {
-        background-color: white;
-        border-radius: 15px;
-        padding: 20px;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        margin-bottom: 20px;
-        transition: transform 0.3s ease;
-    }
-    .food-card:hover {
-        transform: translateY(-5px);
-    }
-    .section-header {
-        font-size: 1.5rem;
-        font-weight: 600;
-        margin-bottom: 15px;
-        border-bottom: 2px solid #f0f0f0;
-        padding-bottom: 8px;
-    }
-    .food-item {
-        display: flex;
-        align-items: center;
-        margin-bottom: 10px;
-        padding: 8px;
-        border-radius: 8px;
-        background-color: #f8f9fa;
-    }
-    .food-icon {
-        margin-right: 15px;
-        font-size: 1.2rem;
-    }
-    .food-text {
-        font-size: 1rem;
-        color: #333;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    if st.session_state.prediction:
-        header_text = "Diet Recommendations for Heart Health Improvement"
-        background_color = "#FFEEEE"  # Light red background
-        border_color = "#ff4b4b"
-        icon = "❤️‍🩹"
-    else:
-        header_text = "Diet Recommendations for Heart Health Maintenance"
-        background_color = "#EEFFEE"  # Light green background
-        border_color = "#00AA00"
-        icon = "💚"
-    
-    # Instagram-like header
-    st.markdown(f"""
-    <div style="text-align: center; margin-bottom: 30px;">
-        <div style="font-size: 2.2rem; font-weight: bold; color: #262730;">{icon} {header_text}</div>
-        <div style="font-size: 1.2rem; color: #4a4a4a; margin-top: 10px;">
-            Personalized nutrition advice for {st.session_state.user_data['name']}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
     
-    # Get appropriate diet recommendations
-    recommendations = get_diet_recommendations(st.session_state.prediction)
+        # Add user profile header
+        st.subheader(f"{st.session_state.user_data['name']}'s Health Profile")
     
-    # Show featured image in a card like Instagram post
-    col1, col2, col3 = st.columns([1, 3, 1])
-    with col2:
+        # Add assessment result
         st.markdown(f"""
-        <div class="food-card" style="border-top: 5px solid {border_color};">
-            <div style="text-align: center; margin-bottom: 15px;">
-                <div style="font-weight: 600; font-size: 1.2rem;">Featured Healthy Foods</div>
-            </div>
-        """, unsafe_allow_html=True)
-        st.image(food_images[2], use_container_width=True)
-        st.markdown("""
-            <div style="text-align: center; font-style: italic; color: #666; margin-top: 10px;">
-                A nutritious diet is essential for heart health
-            </div>
+        <div style="padding: 15px; background-color: {background_color}; border-radius: 8px; margin: 15px 0;">
+            <span style="font-size: 1.3rem; font-weight: 500;">{emoji} {header_text}</span>
+            <p style="margin-top: 10px;">
+                Based on your provided health information, our assessment shows 
+                {'indicators of heart disease risk factors' if st.session_state.prediction else 'no significant indicators of heart disease'}.
+            </p>
         </div>
         """, unsafe_allow_html=True)
     
-    # Display recommendations in a social media feed style
-    food_icons = ["🥗", "🥦", "🍎", "🥑", "🐟", "🫐", "🍗", "🍚", "🥛", "🌰"]
+        # Display user information in a clean format
+        st.write("### Your Health Information")
     
-    for i, (section, items) in enumerate(recommendations.items()):
-        st.markdown(f"""
-        <div class="food-card">
-            <div class="section-header">{section}</div>
-        """, unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.write(f"**Age:** {st.session_state.user_data['age']} years")
+            st.write(f"**Gender:** {st.session_state.user_data['gender']}")
+            st.write(f"**Chest Pain Type:** Type {st.session_state.user_data['chest_pain_type']}")
+    
+        with col2:
+            st.write(f"**Blood Pressure:** {st.session_state.user_data['blood_pressure']} mmHg")
+            st.write(f"**Cholesterol:** {st.session_state.user_data['cholesterol']} mg/dL")
+    
+        # Close the card div
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+        # Create action buttons in a social media style
+        col1, col2, col3 = st.columns([1, 1, 1])
+    
+        with col1:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">🥗</div>
+                <div style="font-weight: 500; margin-bottom: 5px;">Diet Plan</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if st.button("View Recommendations", key="diet_button"):
+                navigate_to('diet')
+    
+        with col2:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">📋</div>
+                <div style="font-weight: 500; margin-bottom: 5px;">Health Report</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if st.button("Download PDF", key="report_button"):
+                submit_report_job(
+                    "report_button",
+                    get_diet_recommendations(st.session_state.prediction)
+                )
         
-        for j, item in enumerate(items):
-            icon = food_icons[(i + j) % len(food_icons)]
-            st.markdown(f"""
-            <div class="food-item">
-                <div class="food-icon">{icon}</div>
-                <div class="food-text">{item}</div>
+            # Serve the finished PDF as a download instead of an inline data URI
+            show_report_job("report_button")
+    
+        with col3:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">🏠</div>
+                <div style="font-weight: 500; margin-bottom: 5px;">New Assessment</div>
             </div>
             """, unsafe_allow_html=True)
+            if st.button("Start Over", key="home_button"):
+                # Reset session state
+                st.session_state.prediction = None
+                st.session_state.user_data = {}
+                clear_report_jobs()
+                navigate_to('home')
             
-        st.markdown("</div>", unsafe_allow_html=True)
+        # Add disclaimer at the bottom
+        st.markdown("""
+        <div style="margin-top: 30px; padding: 15px; background-color: #f8f9fa; border-radius: 10px; font-size: 0.9rem; color: #666;">
+            <strong>Disclaimer:</strong> This assessment is for informational purposes only and is not a substitute for professional medical advice. 
+            Please consult with a healthcare provider for proper diagnosis and treatment.
+        </div>
+        """, unsafe_allow_html=True)
+
+    # DIET RECOMMENDATIONS PAGE
+    elif st.session_state.page == 'diet':
+        # Apply custom CSS for social media-like interface
+        st.markdown("""
+        <style>
+        .main {
+            background-color: #f0f2f6;
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+        }
+        .food-card {
+            background-color: white;
+            border-radius: 15px;
+            padding: 20px;
+            box-shadow: 0 4px 10px rgba(0,0,0,0.1);
+            margin-bottom: 20px;
+            transition: transform 0.3s ease;
+        }
+        .food-card:hover {
+            transform: translateY(-5px);
+        }
+        .section-header {
+            font-size: 1.5rem;
+            font-weight: 600;
+            margin-bottom: 15px;
+            border-bottom: 2px solid #f0f0f0;
+            padding-bottom: 8px;
+        }
+        .food-item {
+            display: flex;
+            align-items: center;
+            margin-bottom: 10px;
+            padding: 8px;
+            border-radius: 8px;
+            background-color: #f8f9fa;
+        }
+        .food-icon {
+            margin-right: 15px;
+            font-size: 1.2rem;
+        }
+        .food-text {
+            font-size: 1rem;
+            color: #333;
+        }
+        </style>
+        """, unsafe_allow_html=True)
     
-    # Display food gallery
-    st.markdown("""
-    <div style="margin: 30px 0;">
-        <div style="font-size: 1.5rem; font-weight: 600; margin-bottom: 15px; text-align: center;">
-            Healthy Food Gallery
+        if st.session_state.prediction:
+            header_text = "Diet Recommendations for Heart Health Improvement"
+            background_color = "#FFEEEE"  # Light red background
+            border_color = "#ff4b4b"
+            icon = "❤️‍🩹"
+        else:
+            header_text = "Diet Recommendations for Heart Health Maintenance"
+            background_color = "#EEFFEE"  # Light green background
+            border_color = "#00AA00"
+            icon = "💚"
+    
+        # Instagram-like header
+        st.markdown(f"""
+        <div style="text-align: center; margin-bottom: 30px;">
+            <div style="font-size: 2.2rem; font-weight: bold; color: #262730;">{icon} {header_text}</div>
+            <div style="font-size: 1.2rem; color: #4a4a4a; margin-top: 10px;">
+                Personalized nutrition advice for {st.session_state.user_data['name']}
+            </div>
         </div>
-    </div>
-    """, unsafe_allow_html=True)
+        """, unsafe_allow_html=True)
     
-    # Display food images in a grid
-    col1, col2 = st.columns(2)
-    with col1:
-        st.image(food_images[0], use_container_width=True, caption="Fresh Fruits & Vegetables")
-    with col2:
-        st.image(food_images[1], use_container_width=True, caption="Whole Grains & Nuts")
+        # Get appropriate diet recommendations
+        recommendations = get_diet_recommendations(st.session_state.prediction)
     
-    # Action buttons in a fixed bottom bar style
-    st.markdown("""
-    <div style="position: fixed; bottom: 0; left: 0; width: 100%; background-color: white; box-shadow: 0 -2px 10px rgba(0,0,0,0.1); padding: 15px 0; z-index: 1000;">
-        <div style="display: flex; justify-content: space-around; max-width: 800px; margin: 0 auto;">
-    """, unsafe_allow_html=True)
+        # Show featured image in a card like Instagram post
+        col1, col2, col3 = st.columns([1, 3, 1])
+        with col2:
+            st.markdown(f"""
+            <div class="food-card" style="border-top: 5px solid {border_color};">
+                <div style="text-align: center; margin-bottom: 15px;">
+                    <div style="font-weight: 600; font-size: 1.2rem;">Featured Healthy Foods</div>
+                </div>
+            """, unsafe_allow_html=True)
+            st.image(food_images[2], use_container_width=True)
+            st.markdown("""
+                <div style="text-align: center; font-style: italic; color: #666; margin-top: 10px;">
+                    A nutritious diet is essential for heart health
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns([1, 1, 1])
+        # Display recommendations in a social media feed style
+        for block in recommendation_blocks(recommendations.content_hash, recommendations):
+            st.markdown(block, unsafe_allow_html=True)
     
-    with col1:
+        # Display food gallery
         st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">👈</div>
-            <div style="font-weight: 500; font-size: 0.9rem;">Back to Results</div>
+        <div style="margin: 30px 0;">
+            <div style="font-size: 1.5rem; font-weight: 600; margin-bottom: 15px; text-align: center;">
+                Healthy Food Gallery
+            </div>
         </div>
         """, unsafe_allow_html=True)
-        if st.button("Return", key="back_button"):
-            navigate_to('results')
     
-    with col2:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">📱</div>
-            <div style="font-weight: 500; font-size: 0.9rem;">Share Diet Plan</div>
-        </div>
-        """, unsafe_allow_html=True)
-        if st.button("Generate Report", key="report_button_diet"):
-            report = generate_report(
-                st.session_state.user_data,
-                st.session_state.prediction,
-                recommendations
-            )
-            
-            # Create download button for the PDF
-            b64_pdf = base64.b64encode(report).decode('utf-8')
-            href = f'<a href="data:application/pdf;base64,{b64_pdf}" download="heart_health_report.pdf" style="text-decoration: none;"><div style="text-align: center; background-color: #f0f0f0; padding: 8px; border-radius: 5px; color: #333; font-weight: 500;">Download Report</div></a>'
-            st.markdown(href, unsafe_allow_html=True)
+        # Display food images in a grid
+        col1, col2 = st.columns(2)
+        with col1:
+            st.image(food_images[0], use_container_width=True, caption="Fresh Fruits & Vegetables")
+        with col2:
+            st.image(food_images[1], use_container_width=True, caption="Whole Grains & Nuts")
     
-    with col3:
+        # Action buttons in a fixed bottom bar style
         st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 1.5rem; margin-bottom: 5px;">🏠</div>
-            <div style="font-weight: 500; font-size: 0.9rem;">New Assessment</div>
-        </div>
+        <div style="position: fixed; bottom: 0; left: 0; width: 100%; background-color: white; box-shadow: 0 -2px 10px rgba(0,0,0,0.1); padding: 15px 0; z-index: 1000;">
+            <div style="display: flex; justify-content: space-around; max-width: 800px; margin: 0 auto;">
         """, unsafe_allow_html=True)
-        if st.button("Start New", key="home_button_diet"):
-            # Reset session state
-            st.session_state.prediction = None
-            st.session_state.user_data = {}
-            navigate_to('home')
     
-    st.markdown("</div></div>", unsafe_allow_html=True)
+        col1, col2, col3 = st.columns([1, 1, 1])
+    
+        with col1:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">👈</div>
+                <div style="font-weight: 500; font-size: 0.9rem;">Back to Results</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if st.button("Return", key="back_button"):
+                navigate_to('results')
+    
+        with col2:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">📱</div>
+                <div style="font-weight: 500; font-size: 0.9rem;">Share Diet Plan</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if st.button("Generate Report", key="report_button_diet"):
+                submit_report_job("report_button_diet", recommendations)
+        
+            # Serve the finished PDF as a download instead of an inline data URI
+            show_report_job("report_button_diet")
+    
+        with col3:
+            st.markdown("""
+            <div style="text-align: center;">
+                <div style="font-size: 1.5rem; margin-bottom: 5px;">🏠</div>
+                <div style="font-weight: 500; font-size: 0.9rem;">New Assessment</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if st.button("Start New", key="home_button_diet"):
+                # Reset session state
+                st.session_state.prediction = None
+                st.session_state.user_data = {}
+                clear_report_jobs()
+                navigate_to('home')
+    
+        st.markdown("</div></div>", unsafe_allow_html=True)
     
-    # Add padding at the bottom to account for the fixed bar
-    st.markdown("<div style='height: 100px;'></div>", unsafe_allow_html=True)
+        # Add padding at the bottom to account for the fixed bar
+        st.markdown("<div style='height: 100px;'></div>", unsafe_allow_html=True)
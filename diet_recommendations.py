@@ -1,3 +1,119 @@
+import hashlib
+import json
+import timeit
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Base recommendations for everyone
+BASE_RECOMMENDATIONS = {
+    "Foods to Include": (
+        "Fresh fruits and vegetables (aim for 5+ servings daily)",
+        "Whole grains (brown rice, whole wheat bread, oats)",
+        "Lean proteins (fish, skinless poultry, legumes)",
+        "Healthy fats (olive oil, avocados, nuts)",
+        "Low-fat dairy or dairy alternatives"
+    ),
+    "Limit or Avoid": (
+        "Processed foods high in sodium",
+        "Added sugars and sweetened beverages",
+        "Excessive alcohol consumption",
+        "Deep-fried foods and trans fats"
+    )
+}
+
+# Additional recommendations for those with heart disease risk
+HEART_DISEASE_RECOMMENDATIONS = {
+    "Foods to Include": (
+        "Omega-3 rich fish (salmon, mackerel, sardines) at least twice weekly",
+        "Berries (especially blueberries and strawberries)",
+        "Oats and barley for their beta-glucan content",
+        "Nuts and seeds (walnuts, flaxseeds, chia seeds)",
+        "Green leafy vegetables (spinach, kale)",
+        "Beans and legumes for plant protein and fiber",
+        "Low-sodium herbs and spices for flavoring"
+    ),
+    "Specific Heart-Healthy Tips": (
+        "Limit sodium to less than 1,500 mg per day",
+        "Reduce saturated fat to less than 7% of daily calories",
+        "Avoid trans fats completely",
+        "Limit added sugars to less than 25g (6 teaspoons) per day",
+        "Consider the DASH or Mediterranean diet approach",
+        "Stay hydrated with water instead of sugary beverages",
+        "Limit red meat to once a week or less"
+    ),
+    "Dietary Pattern Recommendation": (
+        "Follow a Mediterranean-style diet rich in fruits, vegetables, whole grains, and healthy fats",
+        "Consider consulting with a registered dietitian for a personalized plan",
+        "Keep a food journal to track sodium, fat, and sugar intake",
+        "Prepare meals at home to control ingredients and portion sizes"
+    )
+}
+
+# For those without heart disease, add general health maintenance tips
+MAINTENANCE_RECOMMENDATIONS = {
+    "Heart Health Maintenance": (
+        "Maintain a balanced diet with plenty of fruits and vegetables",
+        "Choose whole grains over refined grains",
+        "Include lean proteins and plant-based protein sources",
+        "Stay physically active with at least 150 minutes of moderate exercise weekly",
+        "Maintain a healthy weight",
+        "Consider regular health check-ups to monitor blood pressure and cholesterol"
+    )
+}
+
+
+class DietRecommendations(Mapping):
+    """
+    Immutable, ordered diet recommendation sections.
+    
+    Sections map to tuples of items. `content_hash` is a SHA-256 digest of the
+    sections and items in order, stable across processes, so it can be used as a
+    cache key for rendered pages and reports.
+    """
+    
+    def __init__(self, sections):
+        self._sections = MappingProxyType({section: tuple(items) for section, items in sections.items()})
+        payload = json.dumps(list(self._sections.items()), ensure_ascii=False, separators=(',', ':'))
+        self.content_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def __getitem__(self, section):
+        return self._sections[section]
+    
+    def __iter__(self):
+        return iter(self._sections)
+    
+    def __len__(self):
+        return len(self._sections)
+    
+    def __eq__(self, other):
+        # Section order is part of the content, so compare hashes rather than as plain mappings
+        if not isinstance(other, DietRecommendations):
+            return NotImplemented
+        return self.content_hash == other.content_hash
+    
+    def __hash__(self):
+        return hash(self.content_hash)
+    
+    def __repr__(self):
+        return f"DietRecommendations({dict(self._sections)!r})"
+
+def _merge(*recommendation_sets):
+    """
+    Combine recommendation sets, keeping first-seen section order and appending
+    items of sections that appear in several sets.
+    """
+    merged = {}
+    for recommendations in recommendation_sets:
+        for section, items in recommendations.items():
+            merged[section] = merged.get(section, ()) + tuple(items)
+    return DietRecommendations(merged)
+
+# Compiled once at import, keyed by prediction outcome
+_RECOMMENDATIONS = {
+    True: _merge(BASE_RECOMMENDATIONS, HEART_DISEASE_RECOMMENDATIONS),
+    False: _merge(BASE_RECOMMENDATIONS, MAINTENANCE_RECOMMENDATIONS),
+}
+
 def get_diet_recommendations(has_heart_disease):
     """
     Return diet recommendations based on heart disease prediction.
@@ -6,80 +122,16 @@ def get_diet_recommendations(has_heart_disease):
         has_heart_disease (bool): Whether the user has heart disease or not
     
     Returns:
-        dict: Dictionary containing diet recommendations
+        DietRecommendations: Read-only mapping of section name to a tuple of recommendations,
+        shared between calls
     """
-    # Base recommendations for everyone
-    base_recommendations = {
-        "Foods to Include": [
-            "Fresh fruits and vegetables (aim for 5+ servings daily)",
-            "Whole grains (brown rice, whole wheat bread, oats)",
-            "Lean proteins (fish, skinless poultry, legumes)",
-            "Healthy fats (olive oil, avocados, nuts)",
-            "Low-fat dairy or dairy alternatives"
-        ],
-        "Limit or Avoid": [
-            "Processed foods high in sodium",
-            "Added sugars and sweetened beverages",
-            "Excessive alcohol consumption",
-            "Deep-fried foods and trans fats"
-        ]
-    }
-    
-    # Additional recommendations for those with heart disease risk
-    if has_heart_disease:
-        heart_disease_recommendations = {
-            "Foods to Include": [
-                "Omega-3 rich fish (salmon, mackerel, sardines) at least twice weekly",
-                "Berries (especially blueberries and strawberries)",
-                "Oats and barley for their beta-glucan content",
-                "Nuts and seeds (walnuts, flaxseeds, chia seeds)",
-                "Green leafy vegetables (spinach, kale)",
-                "Beans and legumes for plant protein and fiber",
-                "Low-sodium herbs and spices for flavoring"
-            ],
-            "Specific Heart-Healthy Tips": [
-                "Limit sodium to less than 1,500 mg per day",
-                "Reduce saturated fat to less than 7% of daily calories",
-                "Avoid trans fats completely",
-                "Limit added sugars to less than 25g (6 teaspoons) per day",
-                "Consider the DASH or Mediterranean diet approach",
-                "Stay hydrated with water instead of sugary beverages",
-                "Limit red meat to once a week or less"
-            ],
-            "Dietary Pattern Recommendation": [
-                "Follow a Mediterranean-style diet rich in fruits, vegetables, whole grains, and healthy fats",
-                "Consider consulting with a registered dietitian for a personalized plan",
-                "Keep a food journal to track sodium, fat, and sugar intake",
-                "Prepare meals at home to control ingredients and portion sizes"
-            ]
-        }
-        
-        # Combine base and heart disease specific recommendations
-        recommendations = {}
-        for key in set(list(base_recommendations.keys()) + list(heart_disease_recommendations.keys())):
-            if key in base_recommendations and key in heart_disease_recommendations:
-                recommendations[key] = base_recommendations[key] + heart_disease_recommendations[key]
-            elif key in base_recommendations:
-                recommendations[key] = base_recommendations[key]
-            else:
-                recommendations[key] = heart_disease_recommendations[key]
-                
-        return recommendations
-    else:
-        # For those without heart disease, add general health maintenance tips
-        maintenance_recommendations = {
-            "Heart Health Maintenance": [
-                "Maintain a balanced diet with plenty of fruits and vegetables",
-                "Choose whole grains over refined grains",
-                "Include lean proteins and plant-based protein sources",
-                "Stay physically active with at least 150 minutes of moderate exercise weekly",
-                "Maintain a healthy weight",
-                "Consider regular health check-ups to monitor blood pressure and cholesterol"
-            ]
-        }
-        
-        # Combine base and maintenance recommendations
-        recommendations = base_recommendations.copy()
-        recommendations.update(maintenance_recommendations)
-        
-        return recommendations
+    return _RECOMMENDATIONS[bool(has_heart_disease)]
+
+if __name__ == "__main__":
+    # Microbenchmark: per-call cost of looking up the precompiled recommendations
+    n_calls = 1_000_000
+    for outcome in (True, False):
+        seconds = timeit.timeit(lambda: get_diet_recommendations(outcome), number=n_calls)
+        recommendations = get_diet_recommendations(outcome)
+        print(f"has_heart_disease={outcome}: {seconds / n_calls * 1e9:.0f} ns/call, "
+              f"{len(recommendations)} sections, hash {recommendations.content_hash[:12]}")
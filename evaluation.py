@@ -0,0 +1,348 @@
+import argparse
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from validation import FEATURE_COLUMNS
+
+# In-memory cache of positive-class scores keyed by (model fingerprint, data fingerprint)
+_score_cache = {}
+
+# Metrics estimated for every bootstrap resample
+BOOTSTRAP_METRICS = ('roc_auc', 'accuracy', 'brier')
+
+# Resamples handled per pool task
+BOOTSTRAP_BLOCK = 25
+
+
+def _fingerprint_model(model):
+    return hashlib.sha256(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def _fingerprint_data(X):
+    values = np.ascontiguousarray(np.asarray(X, dtype=np.float64))
+    digest = hashlib.sha256(str(values.shape).encode())
+    digest.update(values.data)
+    return digest.hexdigest()
+
+
+def predict_scores(model, X, cache_dir=None):
+    """
+    Return the model's positive-class probabilities for X, computed once per model and dataset.
+
+    Args:
+        model: Fitted classifier with `predict_proba`
+        X (DataFrame or array-like): Samples with the FEATURE_COLUMNS features; arrays
+            must have the columns in FEATURE_COLUMNS order
+        cache_dir (str): Optional directory to persist scores across processes
+
+    Returns:
+        numpy.ndarray: Score for every sample
+    """
+    if isinstance(X, pd.DataFrame):
+        # Select by name; arrays are assumed to already be in FEATURE_COLUMNS order
+        X = X[FEATURE_COLUMNS]
+    key = (_fingerprint_model(model), _fingerprint_data(X))
+    if key in _score_cache:
+        return _score_cache[key]
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f"scores-{key[0][:16]}-{key[1][:16]}.npy")
+        if os.path.exists(cache_path):
+            _score_cache[key] = np.load(cache_path)
+            return _score_cache[key]
+
+    X = pd.DataFrame(np.asarray(X), columns=FEATURE_COLUMNS)
+    scores = model.predict_proba(X)[:, list(model.classes_).index(1)]
+    _score_cache[key] = scores
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(cache_path, scores)
+    return scores
+
+
+def _trapezoid(y, x):
+    return float(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2))
+
+
+def _binary_clf_curve(y, scores):
+    # True/false positive counts at every distinct threshold, highest threshold first
+    order = np.argsort(scores, kind='mergesort')[::-1]
+    scores = scores[order]
+    y = y[order]
+    threshold_idxs = np.r_[np.flatnonzero(np.diff(scores)), y.size - 1]
+    tps = np.cumsum(y)[threshold_idxs]
+    fps = 1 + threshold_idxs - tps
+    return fps, tps, scores[threshold_idxs]
+
+
+def roc_curve(y, scores):
+    """
+    Compute the ROC curve.
+
+    Returns:
+        tuple: (false positive rates, true positive rates, thresholds)
+    """
+    fps, tps, thresholds = _binary_clf_curve(np.asarray(y), np.asarray(scores))
+    fpr = np.r_[0.0, fps / fps[-1]] if fps[-1] else np.r_[0.0, np.zeros_like(fps, dtype=float)]
+    tpr = np.r_[0.0, tps / tps[-1]] if tps[-1] else np.r_[0.0, np.zeros_like(tps, dtype=float)]
+    return fpr, tpr, np.r_[np.inf, thresholds]
+
+
+def precision_recall_curve(y, scores):
+    """
+    Compute the precision-recall curve.
+
+    Returns:
+        tuple: (precision, recall, thresholds), ordered by decreasing threshold
+    """
+    fps, tps, thresholds = _binary_clf_curve(np.asarray(y), np.asarray(scores))
+    precision = tps / (tps + fps)
+    recall = tps / tps[-1] if tps[-1] else np.zeros_like(tps, dtype=float)
+    return np.r_[1.0, precision], np.r_[0.0, recall], thresholds
+
+
+def calibration_curve(y, scores, n_bins=10):
+    """
+    Compare predicted probabilities with observed outcome frequencies.
+
+    Returns:
+        dict: Mean predicted probability, observed positive rate and sample count for
+        every non-empty bin, plus the expected calibration error
+    """
+    y = np.asarray(y, dtype=np.float64)
+    scores = np.asarray(scores, dtype=np.float64)
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    bins = np.clip(np.digitize(scores, edges[1:-1]), 0, n_bins - 1)
+    counts = np.bincount(bins, minlength=n_bins)
+    filled = counts > 0
+    mean_predicted = np.bincount(bins, scores, minlength=n_bins)[filled] / counts[filled]
+    observed = np.bincount(bins, y, minlength=n_bins)[filled] / counts[filled]
+    return {
+        'mean_predicted': mean_predicted,
+        'observed': observed,
+        'counts': counts[filled],
+        'ece': float(np.sum(counts[filled] * np.abs(mean_predicted - observed)) / y.size),
+    }
+
+
+def threshold_sweep(y, scores, thresholds=None):
+    """
+    Confusion-matrix metrics for every decision threshold at once.
+
+    Args:
+        y (array-like): True labels (0/1)
+        scores (array-like): Positive-class probabilities
+        thresholds (array-like): Thresholds to evaluate; predicts positive when score >= threshold
+
+    Returns:
+        DataFrame: One row per threshold with tp/fp/tn/fn, accuracy, precision, recall, specificity and f1
+    """
+    y = np.asarray(y)
+    scores = np.asarray(scores)
+    thresholds = np.linspace(0.0, 1.0, 101) if thresholds is None else np.asarray(thresholds, dtype=np.float64)
+
+    order = np.argsort(scores, kind='mergesort')
+    sorted_scores = scores[order]
+    positives_below = np.r_[0, np.cumsum(y[order])]
+    n, n_pos = y.size, int(y.sum())
+
+    below = np.searchsorted(sorted_scores, thresholds, side='left')
+    tp = n_pos - positives_below[below]
+    fp = (n - below) - tp
+    fn = n_pos - tp
+    tn = (n - n_pos) - fp
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 1.0)
+        recall = np.where(n_pos > 0, tp / max(n_pos, 1), 0.0)
+        specificity = np.where(tn + fp > 0, tn / (tn + fp), 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+
+    return pd.DataFrame({
+        'threshold': thresholds,
+        'tp': tp, 'fp': fp, 'tn': tn, 'fn': fn,
+        'accuracy': (tp + tn) / n,
+        'precision': precision,
+        'recall': recall,
+        'specificity': specificity,
+        'f1': f1,
+    })
+
+
+# Bootstrap worker state, sent once per process through the pool initializer
+_worker_data = {}
+
+
+def _init_bootstrap_worker(y, scores, threshold):
+    order = np.argsort(scores, kind='mergesort')
+    # Group equal scores so ties count half in the AUC
+    groups = np.empty(scores.size, dtype=np.int64)
+    groups[order] = np.r_[0, np.cumsum(np.diff(scores[order]) != 0)]
+    _worker_data.update(
+        y=y.astype(np.float64),
+        groups=groups,
+        n_groups=int(groups.max()) + 1 if groups.size else 0,
+        correct=((scores >= threshold) == (y == 1)).astype(np.float64),
+        squared_error=(scores - y) ** 2,
+    )
+
+
+def _bootstrap_resamples(seed, n_resamples):
+    # Each resample is expressed as per-sample weights (how often a row was drawn),
+    # which keeps every metric a weighted sum over the original arrays
+    y = _worker_data['y']
+    groups = _worker_data['groups']
+    n_groups = _worker_data['n_groups']
+    n = y.size
+    rng = np.random.default_rng(seed)
+    results = np.empty((n_resamples, len(BOOTSTRAP_METRICS)))
+
+    for i in range(n_resamples):
+        weights = np.bincount(rng.integers(0, n, n), minlength=n).astype(np.float64)
+        pos = np.bincount(groups, weights * y, minlength=n_groups)
+        neg = np.bincount(groups, weights * (1 - y), minlength=n_groups)
+        n_pos, n_neg = pos.sum(), neg.sum()
+        neg_below = np.cumsum(neg) - neg
+        auc = np.sum(pos * (neg_below + 0.5 * neg)) / (n_pos * n_neg) if n_pos and n_neg else np.nan
+        results[i] = (
+            auc,
+            weights @ _worker_data['correct'] / n,
+            weights @ _worker_data['squared_error'] / n,
+        )
+    return results
+
+
+def bootstrap_ci(y, scores, n_bootstrap=1000, confidence=0.95, threshold=0.5, n_jobs=None, seed=0):
+    """
+    Bootstrap confidence intervals for ROC AUC, accuracy and Brier score.
+
+    Resamples are split across a process pool. Using the same seed and sample count
+    for several models draws identical resamples, so their intervals are paired.
+
+    Args:
+        y (array-like): True labels (0/1)
+        scores (array-like): Positive-class probabilities
+        n_bootstrap (int): Number of resamples
+        confidence (float): Confidence level of the intervals
+        threshold (float): Decision threshold for accuracy
+        n_jobs (int): Worker processes; defaults to the CPU count, 1 runs in-process
+        seed (int): Random seed
+
+    Returns:
+        dict: Metric name to (lower, upper) bounds
+    """
+    y = np.asarray(y)
+    scores = np.asarray(scores, dtype=np.float64)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    # Fixed-size blocks with their own seeds keep the result independent of n_jobs
+    sizes = [min(BOOTSTRAP_BLOCK, n_bootstrap - start) for start in range(0, n_bootstrap, BOOTSTRAP_BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if n_jobs == 1:
+        _init_bootstrap_worker(y, scores, threshold)
+        results = [_bootstrap_resamples(s, size) for s, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes)), initializer=_init_bootstrap_worker,
+                                 initargs=(y, scores, threshold)) as executor:
+            results = list(executor.map(_bootstrap_resamples, seeds, sizes))
+
+    samples = np.vstack(results)
+    alpha = (1 - confidence) / 2
+    lower, upper = np.nanquantile(samples, [alpha, 1 - alpha], axis=0)
+    return {metric: (float(lo), float(hi)) for metric, lo, hi in zip(BOOTSTRAP_METRICS, lower, upper)}
+
+
+def evaluate_scores(y, scores, threshold=0.5, n_bootstrap=1000, n_jobs=None, seed=0, n_bins=10):
+    """
+    Compute curves, point metrics and bootstrap intervals from precomputed scores.
+    """
+    y = np.asarray(y).astype(np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    fpr, tpr, roc_thresholds = roc_curve(y, scores)
+    precision, recall, pr_thresholds = precision_recall_curve(y, scores)
+
+    evaluation = {
+        'n_samples': int(y.size),
+        'roc_auc': _trapezoid(tpr, fpr),
+        'average_precision': float(np.sum(np.diff(recall) * precision[1:])),
+        'accuracy': float(np.mean((scores >= threshold) == (y == 1))),
+        'brier': float(np.mean((scores - y) ** 2)),
+        'roc_curve': {'fpr': fpr, 'tpr': tpr, 'thresholds': roc_thresholds},
+        'pr_curve': {'precision': precision, 'recall': recall, 'thresholds': pr_thresholds},
+        'calibration': calibration_curve(y, scores, n_bins),
+        'thresholds': threshold_sweep(y, scores),
+    }
+    if n_bootstrap:
+        evaluation['confidence_intervals'] = bootstrap_ci(
+            y, scores, n_bootstrap=n_bootstrap, threshold=threshold, n_jobs=n_jobs, seed=seed
+        )
+    return evaluation
+
+
+def evaluate_model(model, X, y, cache_dir=None, **kwargs):
+    """
+    Evaluate a model from a single `predict_proba` pass.
+
+    Args:
+        model: Fitted classifier
+        X (DataFrame or array-like): Held-out samples
+        y (array-like): Held-out labels
+        cache_dir (str): Optional directory for cached predictions
+        **kwargs: Passed on to `evaluate_scores`
+
+    Returns:
+        dict: Point metrics, ROC/PR/calibration curves, threshold sweep and confidence intervals
+    """
+    return evaluate_scores(y, predict_scores(model, X, cache_dir), **kwargs)
+
+
+def compare_models(models, X, y, cache_dir=None, **kwargs):
+    """
+    Evaluate several candidate models on the same held-out data.
+
+    Args:
+        models (dict): Model name to fitted classifier
+
+    Returns:
+        DataFrame: One row per model with point metrics and confidence intervals
+    """
+    rows = []
+    for name, model in models.items():
+        evaluation = evaluate_model(model, X, y, cache_dir=cache_dir, **kwargs)
+        row = {'model': name}
+        for metric in ('roc_auc', 'average_precision', 'accuracy', 'brier'):
+            row[metric] = evaluation[metric]
+        for metric, (lower, upper) in evaluation.get('confidence_intervals', {}).items():
+            row[f"{metric}_lower"] = lower
+            row[f"{metric}_upper"] = upper
+        rows.append(row)
+    return pd.DataFrame(rows).set_index('model')
+
+
+if __name__ == "__main__":
+    from model import MODEL_PATH, load_model
+    from synthetic_data import TARGET_COLUMN, generate_chunks
+
+    parser = argparse.ArgumentParser(description="Evaluate saved models on a synthetic held-out set.")
+    parser.add_argument('models', nargs='*', default=[MODEL_PATH], help="pickled models to compare")
+    parser.add_argument('--rows', type=int, default=100_000, help="size of the held-out set")
+    parser.add_argument('--seed', type=int, default=7, help="seed for the held-out set")
+    parser.add_argument('--bootstrap', type=int, default=1000, help="number of bootstrap resamples")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes for the bootstrap")
+    parser.add_argument('--cache-dir', default=None, help="directory for cached predictions")
+    args = parser.parse_args()
+
+    data = next(generate_chunks(args.rows, chunk_size=args.rows, seed=args.seed))
+    X = np.column_stack([data[column] for column in FEATURE_COLUMNS])
+    start = time.perf_counter()
+    results = compare_models(
+        {path: load_model(path) for path in args.models}, X, data[TARGET_COLUMN],
+        cache_dir=args.cache_dir, n_bootstrap=args.bootstrap, n_jobs=args.jobs
+    )
+    print(results.to_string(float_format=lambda value: f"{value:.4f}"))
+    print(f"Evaluated {len(args.models)} model(s) on {args.rows} rows in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,207 @@
+import argparse
+import csv
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from streamlit.testing.v1 import AppTest
+from report_queue import get_report_queue
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+# Steps of one simulated session, in order
+STEPS = ('home', 'results', 'diet', 'report')
+
+# AppTest swaps a process-global Runtime stand-in for every script run, so concurrent
+# sessions each get a process of their own, started before the level's clock does
+_start_barrier = None
+
+
+def _current_rss():
+    # Resident set size in bytes; falls back to the peak RSS where /proc is unavailable
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _button(at, label):
+    return next(button for button in at.button if button.label == label)
+
+
+def run_session(rng, timeout=60):
+    """
+    Walk one simulated user through home -> results -> diet -> report.
+
+    Args:
+        rng (numpy.random.Generator): Source of the form values
+        timeout (float): Per script run timeout in seconds
+
+    Returns:
+        dict: Step name to latency in seconds, plus 'report_job', the time the
+        report spent in the background queue from submission to completion
+    """
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    latencies = {'home': _timed(at.run)}
+    if at.exception:
+        raise RuntimeError(f"Home page failed: {at.exception[0].message}")
+
+    at.text_input[0].input("Load Test")
+    at.number_input[0].set_value(int(rng.integers(18, 101)))
+    at.number_input[1].set_value(int(rng.integers(90, 201)))
+    at.number_input[2].set_value(int(rng.integers(100, 501)))
+    at.selectbox[0].select(str(rng.choice(["Male", "Female"])))
+    at.selectbox[1].set_value(at.selectbox[1].options[int(rng.integers(0, 4))])
+    _button(at, "Check Heart Disease Risk").click()
+    latencies['results'] = _timed(at.run)
+
+    at.button(key="diet_button").click()
+    latencies['diet'] = _timed(at.run)
+
+    # The report is built by the background queue; include the wait and the rerun that serves it
+    start = time.perf_counter()
+    at.button(key="report_button_diet").click()
+    at.run()
+    status = get_report_queue().wait(at.session_state.report_jobs["report_button_diet"], timeout=timeout)
+    at.run()
+    latencies['report'] = time.perf_counter() - start
+    latencies['report_job'] = status['elapsed'] if status else np.nan
+
+    if at.exception:
+        raise RuntimeError(f"Session failed: {at.exception[0].message}")
+    return latencies
+
+
+def _init_session_worker(barrier):
+    global _start_barrier
+    _start_barrier = barrier
+
+
+def _run_worker(session_seeds, timeout):
+    # Warm up imports, the model cache and the first script compile, then start with the others
+    AppTest.from_file(APP_FILE, default_timeout=timeout).run()
+    _start_barrier.wait()
+
+    results = []
+    errors = []
+    started = time.time()
+    cpu_start = time.process_time()
+    for session_seed in session_seeds:
+        try:
+            results.append(run_session(np.random.default_rng(session_seed), timeout))
+        except Exception as exc:
+            errors.append(str(exc))
+    return {
+        'results': results,
+        'errors': errors,
+        'started': started,
+        'finished': time.time(),
+        'cpu_time': time.process_time() - cpu_start,
+        'rss': _current_rss(),
+        # Failed jobs still render a page, so they would not show up as session errors
+        'report_jobs_failed': get_report_queue().stats()['failed'],
+    }
+
+
+def run_level(concurrency, sessions_per_worker, seed=0, timeout=60):
+    """
+    Run `concurrency` simulated sessions at a time and measure resource usage.
+
+    Every concurrent session runs in its own process with its own AppTest runtime
+    and report queue, so this measures how independent app processes share the
+    host, not the saturation of a single Streamlit server.
+
+    Returns:
+        dict: Throughput, per-step latency percentiles, CPU use and RSS summed over
+        the session processes, and report job latency for this level
+    """
+    seeds = np.random.SeedSequence([seed, concurrency]).spawn(concurrency * sessions_per_worker)
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(concurrency + 1)
+    # One task per process, so every session process starts fresh with an empty report queue
+    with ProcessPoolExecutor(max_workers=concurrency, mp_context=context, max_tasks_per_child=1,
+                             initializer=_init_session_worker, initargs=(barrier,)) as executor:
+        futures = [executor.submit(_run_worker, seeds[i::concurrency], timeout) for i in range(concurrency)]
+        barrier.wait(timeout=timeout)
+        workers = [future.result() for future in futures]
+
+    wall_time = max(w['finished'] for w in workers) - min(w['started'] for w in workers)
+    results = [latencies for w in workers for latencies in w['results']]
+    level = {
+        'concurrency': concurrency,
+        'sessions': len(results),
+        'errors': sum(len(w['errors']) for w in workers),
+        'throughput': len(results) / wall_time,
+        'cpu_cores': sum(w['cpu_time'] for w in workers) / wall_time,
+        'rss_mb': sum(w['rss'] for w in workers) / 2 ** 20,
+        'rss_mb_per_process': max(w['rss'] for w in workers) / 2 ** 20,
+        'report_jobs_failed': sum(w['report_jobs_failed'] for w in workers),
+    }
+    # Report job latency only covers the jobs submitted by this level's sessions
+    for step in STEPS + ('report_job',):
+        values = [latencies[step] for latencies in results]
+        p50, p95 = np.percentile(values, [50, 95]) if values else (np.nan, np.nan)
+        level[f"{step}_p50"] = p50
+        level[f"{step}_p95"] = p95
+    return level
+
+
+def ramp(levels, sessions_per_worker=3, max_p95=None, seed=0, timeout=60, report=print):
+    """
+    Ramp concurrency through `levels` and collect the saturation curve.
+
+    Args:
+        levels (list): Concurrency levels to try, in order
+        sessions_per_worker (int): Sessions each concurrent worker completes per level
+        max_p95 (float): Stop once any step's p95 latency exceeds this many seconds
+        report (callable): Called with a one-line summary after every level
+
+    Returns:
+        list: One dict per completed level, see `run_level`
+    """
+    curve = []
+    for concurrency in levels:
+        level = run_level(concurrency, sessions_per_worker, seed, timeout)
+        curve.append(level)
+        report(
+            f"{concurrency:>4} sessions  {level['throughput']:6.2f} sessions/s  "
+            + "  ".join(f"{step} p95 {level[f'{step}_p95'] * 1000:7.0f} ms" for step in STEPS)
+            + f"  cpu {level['cpu_cores']:.2f}  rss {level['rss_mb']:.0f} MB"
+            + f"  report job p95 {level['report_job_p95'] * 1000:.0f} ms"
+            + f" ({level['report_jobs_failed']} failed)  errors {level['errors']}"
+        )
+        worst_p95 = max(level[f"{step}_p95"] for step in STEPS)
+        if max_p95 is not None and not worst_p95 <= max_p95:
+            report(f"Stopping: p95 latency {worst_p95:.2f}s exceeds {max_p95:.2f}s")
+            break
+    return curve
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate concurrent app sessions and record a saturation curve.")
+    parser.add_argument('--levels', default='1,2,4,8,16,32', help="comma-separated concurrency levels")
+    parser.add_argument('--sessions', type=int, default=3, help="sessions per concurrent worker at every level")
+    parser.add_argument('--max-p95', type=float, default=None, help="stop ramping once a step's p95 latency exceeds this (seconds)")
+    parser.add_argument('--timeout', type=float, default=60, help="per script run timeout (seconds)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--csv', help="write the saturation curve to this CSV file")
+    args = parser.parse_args()
+
+    curve = ramp(
+        [int(level) for level in args.levels.split(',')], args.sessions,
+        max_p95=args.max_p95, seed=args.seed, timeout=args.timeout
+    )
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(curve[0]))
+            writer.writeheader()
+            writer.writerows(curve)
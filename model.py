@@ -1,9 +1,110 @@
+import argparse
+import copy
+import os
+import pickle
+import stat
+import threading
+import uuid
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
-import pickle
+from validation import FEATURE_COLUMNS
+from synthetic_data import compute_risk_score
+
+MODEL_PATH = 'heart_disease_model.pkl'
+
+# Loaded models keyed by path, along with the file identity they were read from
+_model_cache = {}
+_model_cache_lock = threading.Lock()
+
+def _create_temp_file(path):
+    # Unlike mkstemp, which always creates 0600 files, let the kernel apply the
+    # process umask so nothing has to read (and briefly change) it
+    directory = os.path.dirname(os.path.abspath(path))
+    while True:
+        tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+def save_model(model, path=MODEL_PATH):
+    """
+    Save a model by writing a temporary file next to `path` and renaming it into place.
+    
+    The rename is atomic, so a concurrent `load_model` sees either the old or the
+    new model, never a partially written file.
+    """
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(model, file)
+            file.flush()
+            os.fsync(file.fileno())
+        # New files already honour the umask; replacing a model keeps its existing mode
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _file_identity(file_stat):
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+def load_model(path=MODEL_PATH):
+    """
+    Load a pickled model, reusing the cached copy until the file is replaced.
+    
+    Args:
+        path (str): Path to the pickled model
+        
+    Returns:
+        RandomForestClassifier: The current model. Treat it as read-only, it is shared between callers.
+    """
+    identity = _file_identity(os.stat(path))
+    with _model_cache_lock:
+        cached = _model_cache.get(path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    
+    with open(path, 'rb') as file:
+        # Key the cache on the file actually opened, in case it was swapped after the stat above
+        identity = _file_identity(os.fstat(file.fileno()))
+        model = pickle.load(file)
+    with _model_cache_lock:
+        _model_cache[path] = (identity, model)
+    return model
+
+def predict_heart_disease(user_data, path=MODEL_PATH):
+    """
+    Predict whether a user has heart disease.
+    
+    Args:
+        user_data (dict): Normalized user data as returned by `validation.validate_record`
+        path (str): Path to the pickled model
+        
+    Returns:
+        bool: True if heart disease is predicted
+    """
+    model = load_model(path)
+    
+    # Create a DataFrame from user data
+    input_df = pd.DataFrame([{
+        'age': user_data['age'],
+        'sex': 1 if user_data['gender'] == 'Male' else 0,
+        'cp': int(user_data['chest_pain_type']),
+        'trestbps': user_data['blood_pressure'],
+        'chol': user_data['cholesterol']
+    }])
+    
+    # Make prediction
+    prediction = model.predict(input_df)[0]
+    return bool(prediction)
 
 def train_model():
     """
@@ -33,15 +134,8 @@ def train_model():
         'chol': chol
     })
     
-    # Generate target variable with medical logic
-    # Higher risk factors: older age, male, higher pain level, higher BP, higher cholesterol
-    risk_score = (
-        (df['age'] - 30) / 50 +  # Age factor (normalized)
-        df['sex'] * 0.5 +         # Sex factor (males at higher risk)
-        df['cp'] * 0.3 +          # Chest pain factor
-        (df['trestbps'] - 110) / 80 +  # BP factor (normalized)
-        (df['chol'] - 150) / 250       # Cholesterol factor (normalized)
-    ) 
+    # Generate target variable with medical logic (shared with synthetic_data)
+    risk_score = compute_risk_score(df['age'], df['sex'], df['cp'], df['trestbps'], df['chol'])
     
     # Convert risk score to binary outcome with some randomness
     threshold = risk_score.mean()
@@ -65,8 +159,7 @@ def train_model():
     model.fit(X_train, y_train)
     
     # Save the model
-    with open('heart_disease_model.pkl', 'wb') as file:
-        pickle.dump(model, file)
+    save_model(model)
     
     # Print model accuracy on test set
     accuracy = model.score(X_test, y_test)
@@ -74,5 +167,91 @@ def train_model():
     
     return model
 
+def update_model(X_new, y_new, n_new_trees=20, retire_oldest=0, X_holdout=None, y_holdout=None,
+                 holdout_size=0.2, max_score_drop=0.02, path=MODEL_PATH, random_state=None):
+    """
+    Incrementally update the saved forest with trees trained on newly labeled data.
+    
+    New trees are added with warm-start instead of refitting the whole forest. The
+    candidate is checked on held-out data and only published, via an atomic rename,
+    if its accuracy does not drop by more than `max_score_drop`.
+    
+    Args:
+        X_new (DataFrame or array-like): New samples with the FEATURE_COLUMNS features
+        y_new (array-like): Labels for the new samples
+        n_new_trees (int): Number of trees to add
+        retire_oldest (int): Number of the oldest trees to drop from the forest
+        X_holdout, y_holdout: Held-out data for validation (both or neither); split from the new data if omitted
+        holdout_size (float): Fraction of the new data held out when no holdout is given
+        max_score_drop (float): Largest accepted accuracy drop versus the current model
+        path (str): Path to the pickled model
+        random_state (int): Seed for the holdout split
+        
+    Returns:
+        tuple: (model now being served, dict with the update report)
+    """
+    if (X_holdout is None) != (y_holdout is None):
+        raise ValueError("X_holdout and y_holdout must be given together")
+    X_new = pd.DataFrame(X_new, columns=FEATURE_COLUMNS)
+    y_new = np.asarray(y_new).astype(int)
+    
+    if X_holdout is None:
+        X_train, X_holdout, y_train, y_holdout = train_test_split(
+            X_new, y_new, test_size=holdout_size, stratify=y_new, random_state=random_state
+        )
+    else:
+        X_train, y_train = X_new, y_new
+        X_holdout = pd.DataFrame(X_holdout, columns=FEATURE_COLUMNS)
+        y_holdout = np.asarray(y_holdout).astype(int)
+        if len(X_holdout) != len(y_holdout):
+            raise ValueError(f"X_holdout has {len(X_holdout)} rows but y_holdout has {len(y_holdout)} labels")
+    
+    # Copy the served model so readers of the cached instance are unaffected
+    current = load_model(path)
+    candidate = copy.deepcopy(current)
+    
+    if not np.array_equal(np.unique(y_train), candidate.classes_):
+        raise ValueError("Incremental updates need training data covering every outcome class")
+    n_trees = len(candidate.estimators_)
+    if not 0 <= retire_oldest < n_trees + n_new_trees:
+        raise ValueError(f"Cannot retire {retire_oldest} of {n_trees + n_new_trees} trees")
+    
+    # Fit only the additional trees on the new data
+    candidate.set_params(warm_start=True, n_estimators=n_trees + n_new_trees)
+    candidate.fit(X_train, y_train)
+    
+    # Retire the oldest trees, which sit at the front of the ensemble
+    if retire_oldest:
+        candidate.estimators_ = candidate.estimators_[retire_oldest:]
+    candidate.set_params(warm_start=False, n_estimators=len(candidate.estimators_))
+    
+    baseline_score = current.score(X_holdout, y_holdout)
+    candidate_score = candidate.score(X_holdout, y_holdout)
+    published = candidate_score >= baseline_score - max_score_drop
+    if published:
+        save_model(candidate, path)
+    
+    report = {
+        'published': published,
+        'baseline_score': baseline_score,
+        'candidate_score': candidate_score,
+        'trees_added': n_new_trees,
+        'trees_retired': retire_oldest,
+        'n_estimators': len(candidate.estimators_) if published else n_trees,
+    }
+    return (candidate if published else current), report
+
 if __name__ == "__main__":
-    train_model()
+    parser = argparse.ArgumentParser(description="Train or incrementally update the heart disease model.")
+    parser.add_argument('--update', metavar='CSV', help="CSV of newly labeled data with the feature columns and a 'target' column")
+    parser.add_argument('--trees', type=int, default=20, help="number of trees to add when updating")
+    parser.add_argument('--retire', type=int, default=0, help="number of oldest trees to retire when updating")
+    args = parser.parse_args()
+    
+    if args.update:
+        data = pd.read_csv(args.update)
+        _, report = update_model(data[FEATURE_COLUMNS], data['target'], n_new_trees=args.trees, retire_oldest=args.retire)
+        print(f"Holdout accuracy: {report['baseline_score']:.2f} -> {report['candidate_score']:.2f}")
+        print("Model updated" if report['published'] else "Update rejected, keeping the current model")
+    else:
+        train_model()
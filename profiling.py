@@ -0,0 +1,158 @@
+import contextlib
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+
+# Profiling is opt-in: set HEART_PROFILE=1 to write a report for every profiled render/call
+PROFILE_ENABLED = os.environ.get('HEART_PROFILE', '').lower() not in ('', '0', 'false', 'no')
+PROFILE_DIR = os.environ.get('HEART_PROFILE_DIR', 'profiles')
+PROFILE_TOP = int(os.environ.get('HEART_PROFILE_TOP', '15'))
+
+# Per-thread profiling state: whether a CPU profiler is running and the peaks of nested renders
+_local = threading.local()
+
+# tracemalloc has a single process-wide peak, so profiled regions run one at a time
+# (reentrant for nested renders) to stop one thread's reset_peak() from wiping out
+# the peak another thread is still measuring
+_profile_lock = threading.RLock()
+
+# Keep the profilers' own bookkeeping out of the allocation reports
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _peak_stack():
+    # Running peak of traced memory for every active (nested) render in this thread
+    if not hasattr(_local, 'peaks'):
+        _local.peaks = []
+    return _local.peaks
+
+
+def _start_cpu_profiler():
+    if getattr(_local, 'active', False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ allows only one active profiler per process
+        return None
+    _local.active = True
+    return profiler
+
+
+def _report_path(label):
+    safe_label = re.sub(r'[^A-Za-z0-9_.-]+', '_', label)
+    timestamp = time.strftime('%Y%m%d-%H%M%S')
+    return os.path.join(PROFILE_DIR, f"{timestamp}-{time.time_ns() % 1_000_000:06d}-{os.getpid()}-{safe_label}.txt")
+
+
+def _write_report(label, wall_time, cpu_time, before, after, peak_growth, profiler):
+    lines = [
+        f"Profile: {label}",
+        f"Wall time: {wall_time * 1000:.1f} ms",
+        f"CPU time: {cpu_time * 1000:.1f} ms",
+        f"Peak memory growth: {peak_growth / 1024:.1f} KiB",
+        "",
+        f"Top {PROFILE_TOP} allocating lines (net change during the render):",
+    ]
+    stats = after.filter_traces(_SNAPSHOT_FILTERS).compare_to(before.filter_traces(_SNAPSHOT_FILTERS), 'lineno')
+    for stat in stats[:PROFILE_TOP]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {frame.filename}:{frame.lineno}"
+        )
+    lines.append("")
+
+    if profiler is None:
+        lines.append("cProfile unavailable (another profiler was active).")
+    else:
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('tottime').print_stats(PROFILE_TOP)
+        lines.append(f"Top {PROFILE_TOP} functions by own time (cProfile, this thread only):")
+        lines.append(output.getvalue())
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    with open(_report_path(label), 'w') as file:
+        file.write("\n".join(lines))
+
+
+@contextlib.contextmanager
+def profile_render(label):
+    """
+    Profile memory and CPU usage of the enclosed block and write a report to PROFILE_DIR.
+
+    Memory is traced with tracemalloc. CPU time is broken down with cProfile, a
+    deterministic (not sampling) profiler that only sees the calling thread, so
+    work handed to other threads, such as queued report jobs, is not included.
+
+    Does nothing unless HEART_PROFILE is set. Profiled regions are serialized across
+    threads while profiling is on, so concurrent sessions and report workers wait
+    for each other; allocations from unprofiled threads can still show up in a report.
+
+    Args:
+        label (str): Name of the render or call, used in the report and file name
+    """
+    if not PROFILE_ENABLED:
+        yield
+        return
+
+    with _profile_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # tracemalloc keeps a single peak, so fold it into the enclosing render's running
+        # maximum before resetting it for this one
+        peaks = _peak_stack()
+        if peaks:
+            peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+        before = tracemalloc.take_snapshot()
+        # Measured after the snapshot so its own memory is not counted as growth
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        peaks.append(start_memory)
+        profiler = _start_cpu_profiler()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            # Also runs when Streamlit interrupts the script with st.rerun()
+            cpu_time = time.thread_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+            if profiler is not None:
+                profiler.disable()
+                _local.active = False
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, peaks.pop())
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            after = tracemalloc.take_snapshot()
+            _write_report(label, wall_time, cpu_time, before, after, peak - start_memory, profiler)
+
+
+def profiled(label):
+    """
+    Decorator form of `profile_render`. Returns the function unchanged when profiling is off.
+    """
+    def decorator(func):
+        if not PROFILE_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_render(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
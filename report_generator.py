@@ -1,21 +1,37 @@
+import functools
 import io
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-def generate_report(user_data, prediction, diet_recommendations):
+def generate_report(user_data, prediction, diet_recommendations, use_cache=True):
     """
     Generate a PDF report containing the user's data, prediction results, and diet recommendations.
     
+    Reports for recommendations carrying a `content_hash` (as returned by
+    `get_diet_recommendations`) are cached, so identical requests reuse the PDF,
+    unless `use_cache` is False.
+    
     Args:
         user_data (dict): User's input data
         prediction (bool): Prediction result (True for heart disease, False for no heart disease)
-        diet_recommendations (dict): Dictionary of diet recommendations
+        diet_recommendations (Mapping): Diet recommendations, section name to list of items
+        use_cache (bool): Whether to reuse a cached PDF for identical inputs
         
     Returns:
         bytes: PDF report as bytes
     """
+    if use_cache and getattr(diet_recommendations, 'content_hash', None) is not None:
+        return _cached_report(tuple(sorted(user_data.items())), bool(prediction), diet_recommendations)
+    return _build_report(user_data, prediction, diet_recommendations)
+
+@functools.lru_cache(maxsize=256)
+def _cached_report(user_data_items, prediction, diet_recommendations):
+    # diet_recommendations hashes by its content hash, so it forms part of the cache key
+    return _build_report(dict(user_data_items), prediction, diet_recommendations)
+
+def _build_report(user_data, prediction, diet_recommendations):
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     styles = getSampleStyleSheet()
@@ -0,0 +1,240 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the report queue already holds its maximum number of pending jobs."""
+
+
+class ReportJob:
+    """
+    A single report generation job and its bookkeeping.
+    """
+
+    def __init__(self, job_id, session_id):
+        self.job_id = job_id
+        self.session_id = session_id
+        self.status = QUEUED
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+
+class ReportJobQueue:
+    """
+    Bounded background worker pool for PDF report generation.
+
+    Jobs are identified by an opaque job ID and tagged with the submitting
+    session, so a Streamlit rerun only has to poll `status()` instead of
+    building the PDF inside the script thread.
+    """
+
+    def __init__(self, max_workers=2, max_pending=32, max_finished=256, latency_window=500):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-worker")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._max_pending = max_pending
+        self._max_finished = max_finished
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._latencies = deque(maxlen=latency_window)
+
+    def submit(self, func, *args, session_id=None, **kwargs):
+        """
+        Queue `func(*args, **kwargs)` for background execution.
+
+        Args:
+            func (callable): Function producing the report bytes
+            session_id (str): Identifier of the submitting session
+
+        Returns:
+            str: Job ID used to poll for status and results
+        """
+        job = ReportJob(uuid.uuid4().hex, session_id)
+        with self._lock:
+            if self._pending >= self._max_pending:
+                raise QueueFullError("Report queue is full, please try again shortly.")
+            self._pending += 1
+            self._jobs[job.job_id] = job
+            self._evict_finished()
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job.job_id
+
+    def _run(self, job, func, args, kwargs):
+        with self._lock:
+            job.status = RUNNING
+            job.progress = 0.1
+            job.started_at = time.monotonic()
+            self._running += 1
+        # Anything that is not a clean return, including BaseExceptions such as
+        # KeyboardInterrupt, marks the job failed; the finally block keeps the
+        # pending/running counters balanced either way
+        status, result, error = FAILED, None, "Report generation was interrupted."
+        try:
+            result = func(*args, **kwargs)
+            status, error = DONE, None
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            with self._lock:
+                job.status = status
+                job.result = result
+                job.error = error
+                job.progress = 1.0
+                job.finished_at = time.monotonic()
+                self._pending -= 1
+                self._running -= 1
+                if status == DONE:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._latencies.append(job.finished_at - job.submitted_at)
+
+    def _evict_finished(self):
+        # Caller must hold self._lock; drops the oldest finished jobs first
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self._max_finished)]:
+            del self._jobs[job_id]
+
+    def _describe(self, job):
+        # Caller must hold self._lock
+        now = time.monotonic()
+        return {
+            "job_id": job.job_id,
+            "status": job.status,
+            "progress": job.progress,
+            "error": job.error,
+            "wait_time": (job.started_at or now) - job.submitted_at,
+            "elapsed": (job.finished_at or now) - job.submitted_at,
+        }
+
+    def status(self, job_id):
+        """
+        Return a snapshot of a job's state.
+
+        Args:
+            job_id (str): Job ID returned by `submit`
+
+        Returns:
+            dict: Status, progress and timing information, or None if the job is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else self._describe(job)
+
+    def snapshot(self, job_id):
+        """
+        Return a job's state together with its result, read under a single lock.
+
+        Use this instead of `status` followed by `result` when the report bytes are
+        needed, so the job cannot be evicted or discarded in between.
+
+        Returns:
+            dict: Same as `status` plus "result" (the report bytes once the job is
+            done, otherwise None), or None if the job is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {**self._describe(job), "result": job.result if job.status == DONE else None}
+
+    def result(self, job_id):
+        """
+        Return the report bytes of a finished job, or None if it is not done yet.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != DONE:
+                return None
+            return job.result
+
+    def wait(self, job_id, timeout=None, poll_interval=0.05):
+        """
+        Block until a job finishes. Intended for scripts and tests, not the app itself.
+
+        Returns:
+            dict: Final job status, or the current one if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status(job_id)
+            if status is None or status["status"] in (DONE, FAILED):
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                return status
+            time.sleep(poll_interval)
+
+    def discard(self, job_id):
+        """
+        Forget a finished job and release its result.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.finished:
+                del self._jobs[job_id]
+
+    def stats(self):
+        """
+        Return queue depth and job latency statistics.
+
+        Returns:
+            dict: Counts of queued/running/completed/failed jobs and latency figures in seconds
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            queued = self._pending - self._running
+            stats = {
+                "queued": queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "latency_avg": None,
+                "latency_p50": None,
+                "latency_p95": None,
+            }
+        if latencies:
+            stats["latency_avg"] = sum(latencies) / len(latencies)
+            stats["latency_p50"] = latencies[int(0.50 * (len(latencies) - 1))]
+            stats["latency_p95"] = latencies[int(0.95 * (len(latencies) - 1))]
+        return stats
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_report_queue():
+    """
+    Return the process-wide report queue, creating it on first use.
+
+    The pool size and pending-job limit can be tuned with the
+    REPORT_WORKERS and REPORT_MAX_PENDING environment variables.
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ReportJobQueue(
+                max_workers=int(os.environ.get("REPORT_WORKERS", "2")),
+                max_pending=int(os.environ.get("REPORT_MAX_PENDING", "32")),
+            )
+        return _queue
@@ -0,0 +1,177 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from validation import FEATURE_COLUMNS
+
+TARGET_COLUMN = 'target'
+
+# Feature distributions used by model.train_model. Supported forms:
+#   ('uniform_int', low, high)              integers in [low, high)
+#   ('normal', mean, std, low, high)        rounded normal, clipped to [low, high]
+#   ('bernoulli', p)                        1 with probability p, else 0
+#   ('categorical', [p0, p1, ...])          category i with probability p_i
+DEFAULT_DISTRIBUTIONS = {
+    'age': ('uniform_int', 25, 80),
+    'sex': ('uniform_int', 0, 2),
+    'cp': ('uniform_int', 0, 4),
+    'trestbps': ('uniform_int', 90, 200),
+    'chol': ('uniform_int', 120, 400),
+}
+
+# Rows drawn (from a dedicated seed stream) to estimate the label threshold
+CALIBRATION_ROWS = 200_000
+
+FORMATS = ('csv', 'jsonl', 'npy')
+
+
+def compute_risk_score(age, sex, cp, trestbps, chol):
+    """
+    Risk score used to label synthetic patients.
+
+    Higher risk factors: older age, male, higher pain level, higher BP, higher cholesterol.
+    Works on scalars, NumPy arrays and pandas Series alike.
+    """
+    return (
+        (age - 30) / 50 +         # Age factor (normalized)
+        sex * 0.5 +               # Sex factor (males at higher risk)
+        cp * 0.3 +                # Chest pain factor
+        (trestbps - 110) / 80 +   # BP factor (normalized)
+        (chol - 150) / 250        # Cholesterol factor (normalized)
+    )
+
+
+def _sample(rng, distribution, size):
+    kind, *params = distribution
+    if kind == 'uniform_int':
+        low, high = params
+        return rng.integers(low, high, size, dtype=np.int32)
+    if kind == 'normal':
+        mean, std, low, high = params
+        return np.clip(np.rint(rng.normal(mean, std, size)), low, high).astype(np.int32)
+    if kind == 'bernoulli':
+        (p,) = params
+        return (rng.random(size) < p).astype(np.int32)
+    if kind == 'categorical':
+        (probabilities,) = params
+        return rng.choice(len(probabilities), size=size, p=probabilities).astype(np.int32)
+    raise ValueError(f"Unknown distribution '{kind}'")
+
+
+def _sample_features(rng, distributions, size):
+    return {column: _sample(rng, distributions[column], size) for column in FEATURE_COLUMNS}
+
+
+def estimate_threshold(distributions=None, seed=42):
+    """
+    Estimate the mean risk score under the given distributions.
+
+    model.train_model labels a patient as positive when their risk score is above the
+    dataset mean. A streamed dataset has no global mean up front, so it is estimated
+    from a fixed calibration sample instead.
+    """
+    distributions = {**DEFAULT_DISTRIBUTIONS, **(distributions or {})}
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(0,)))
+    features = _sample_features(rng, distributions, CALIBRATION_ROWS)
+    return float(compute_risk_score(**features).mean())
+
+
+def generate_chunks(n_rows, chunk_size=1_000_000, seed=42, distributions=None, label_noise=0.0, threshold=None):
+    """
+    Generate synthetic patients in chunks with bounded memory.
+
+    Output is deterministic for a given seed and chunk size: every chunk draws from
+    its own child seed, so chunks can also be generated independently.
+
+    Args:
+        n_rows (int): Total number of patients
+        chunk_size (int): Maximum rows per chunk
+        seed (int): Base random seed
+        distributions (dict): Per-feature overrides of DEFAULT_DISTRIBUTIONS
+        label_noise (float): Probability of flipping each label
+        threshold (float): Risk score above which a patient is labeled positive;
+            estimated from the distributions if omitted
+
+    Yields:
+        dict: Column name to int32 array, FEATURE_COLUMNS followed by TARGET_COLUMN
+    """
+    if not 0.0 <= label_noise <= 1.0:
+        raise ValueError("label_noise must be between 0 and 1")
+    distributions = {**DEFAULT_DISTRIBUTIONS, **(distributions or {})}
+    if threshold is None:
+        threshold = estimate_threshold(distributions, seed)
+
+    n_chunks = -(-n_rows // chunk_size)
+    for chunk in range(n_chunks):
+        size = min(chunk_size, n_rows - chunk * chunk_size)
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(1, chunk)))
+        columns = _sample_features(rng, distributions, size)
+        target = compute_risk_score(**columns) > threshold
+        if label_noise:
+            target ^= rng.random(size) < label_noise
+        columns[TARGET_COLUMN] = target.astype(np.int32)
+        yield columns
+
+
+def write_dataset(output_dir, n_rows, fmt='csv', chunk_size=1_000_000, **kwargs):
+    """
+    Stream a synthetic dataset to one file per chunk.
+
+    CSV and JSONL files carry column names; NPY files hold an (n, 6) int32 array with
+    the columns in FEATURE_COLUMNS + [TARGET_COLUMN] order.
+
+    Args:
+        output_dir (str): Directory for the part files (created if needed)
+        n_rows (int): Total number of patients
+        fmt (str): One of 'csv', 'jsonl' or 'npy'
+        chunk_size (int): Rows per part file
+        **kwargs: Passed on to `generate_chunks`
+
+    Returns:
+        list: Paths of the written files
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of {', '.join(FORMATS)}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for i, columns in enumerate(generate_chunks(n_rows, chunk_size=chunk_size, **kwargs)):
+        path = os.path.join(output_dir, f"patients-{i:05d}.{fmt}")
+        if fmt == 'npy':
+            np.save(path, np.column_stack(list(columns.values())))
+        elif fmt == 'csv':
+            pd.DataFrame(columns).to_csv(path, index=False)
+        else:
+            pd.DataFrame(columns).to_json(path, orient='records', lines=True)
+        paths.append(path)
+    return paths
+
+
+def _parse_distribution(text):
+    # "age=normal:55:10:25:80" -> ('age', ('normal', 55.0, 10.0, 25.0, 80.0))
+    column, _, spec = text.partition('=')
+    kind, *params = spec.split(':')
+    if column not in FEATURE_COLUMNS:
+        raise argparse.ArgumentTypeError(f"Unknown feature '{column}'")
+    if kind == 'categorical':
+        return column, (kind, [float(p) for p in params])
+    return column, (kind, *(float(p) if '.' in p else int(p) for p in params))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic patient dataset for stress and scale testing.")
+    parser.add_argument('output_dir', help="directory for the generated part files")
+    parser.add_argument('--rows', type=int, default=10_000_000, help="total number of patients")
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--chunk-size', type=int, default=1_000_000, help="rows per part file")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--label-noise', type=float, default=0.0, help="probability of flipping each label")
+    parser.add_argument('--dist', type=_parse_distribution, action='append', default=[],
+                        help="override a feature distribution, e.g. age=normal:55:10:25:80 or cp=categorical:0.4:0.3:0.2:0.1")
+    args = parser.parse_args()
+
+    paths = write_dataset(
+        args.output_dir, args.rows, fmt=args.format, chunk_size=args.chunk_size,
+        seed=args.seed, distributions=dict(args.dist), label_noise=args.label_noise
+    )
+    print(f"Wrote {args.rows} rows to {len(paths)} files in {args.output_dir}")
@@ -0,0 +1,27 @@
+import pytest
+from diet_recommendations import DietRecommendations, get_diet_recommendations
+
+
+def test_recommendations_are_shared_and_ordered():
+    recommendations = get_diet_recommendations(True)
+
+    assert get_diet_recommendations(1) is recommendations
+    assert list(recommendations) == [
+        "Foods to Include",
+        "Limit or Avoid",
+        "Specific Heart-Healthy Tips",
+        "Dietary Pattern Recommendation",
+    ]
+    assert isinstance(recommendations["Foods to Include"], tuple)
+    with pytest.raises(TypeError):
+        recommendations["Foods to Include"] = ()
+
+
+def test_equality_is_consistent_with_hash():
+    forward = DietRecommendations({"A": ["x"], "B": ["y"]})
+    same = DietRecommendations({"A": ("x",), "B": ("y",)})
+    reordered = DietRecommendations({"B": ["y"], "A": ["x"]})
+
+    assert forward == same and hash(forward) == hash(same)
+    assert forward != reordered
+    assert forward.content_hash != reordered.content_hash
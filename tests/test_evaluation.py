@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import average_precision_score, roc_auc_score
+from evaluation import evaluate_scores, predict_scores
+from validation import FEATURE_COLUMNS
+
+
+def _model_and_data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        'age': rng.integers(25, 80, 200),
+        'sex': rng.integers(0, 2, 200),
+        'cp': rng.integers(0, 4, 200),
+        'trestbps': rng.integers(90, 200, 200),
+        'chol': rng.integers(120, 400, 200),
+    })
+    y = (X['age'] + X['trestbps'] / 2 > 130).astype(int)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+    return model, X, y
+
+
+def test_predict_scores_selects_dataframe_columns_by_name(tmp_path):
+    model, X, _ = _model_and_data()
+    expected = model.predict_proba(X)[:, 1]
+
+    shuffled = X[list(reversed(FEATURE_COLUMNS))]
+
+    np.testing.assert_allclose(predict_scores(model, shuffled, cache_dir=tmp_path), expected)
+    np.testing.assert_allclose(predict_scores(model, X.to_numpy()), expected)
+
+
+def test_evaluate_scores_matches_sklearn():
+    rng = np.random.default_rng(1)
+    y = rng.integers(0, 2, 1000)
+    scores = np.clip(y * 0.3 + rng.random(1000) * 0.7, 0, 1).round(2)
+
+    evaluation = evaluate_scores(y, scores, n_bootstrap=0)
+
+    assert np.isclose(evaluation['roc_auc'], roc_auc_score(y, scores))
+    assert np.isclose(evaluation['average_precision'], average_precision_score(y, scores))
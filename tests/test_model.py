@@ -0,0 +1,98 @@
+import os
+import stat
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from model import load_model, save_model, update_model
+from synthetic_data import compute_risk_score
+from validation import FEATURE_COLUMNS
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_save_model_keeps_existing_file_mode(tmp_path):
+    path = tmp_path / "model.pkl"
+    path.write_bytes(b"")
+    os.chmod(path, 0o644)
+
+    save_model({'trees': 1}, str(path))
+
+    assert _mode(path) == 0o644
+    assert load_model(str(path)) == {'trees': 1}
+
+
+def test_save_model_honours_umask_for_new_files(tmp_path):
+    path = tmp_path / "model.pkl"
+    old_umask = os.umask(0o022)
+    try:
+        save_model({'trees': 2}, str(path))
+    finally:
+        os.umask(old_umask)
+
+    assert _mode(path) == 0o644
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def _patients(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        'age': rng.integers(25, 80, n_rows),
+        'sex': rng.integers(0, 2, n_rows),
+        'cp': rng.integers(0, 4, n_rows),
+        'trestbps': rng.integers(90, 200, n_rows),
+        'chol': rng.integers(120, 400, n_rows),
+    }, columns=FEATURE_COLUMNS)
+    risk = compute_risk_score(X['age'], X['sex'], X['cp'], X['trestbps'], X['chol'])
+    return X, (risk > risk.median()).astype(int).to_numpy()
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    X, y = _patients(200, seed=0)
+    path = str(tmp_path / "model.pkl")
+    save_model(RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y), path)
+    return path
+
+
+def test_update_model_adds_trees_and_retires_the_oldest(model_path):
+    original = load_model(model_path)
+    X, y = _patients(200, seed=1)
+
+    model, report = update_model(
+        X, y, n_new_trees=3, retire_oldest=2, max_score_drop=1.0, path=model_path, random_state=0
+    )
+
+    assert report['published'] and report['n_estimators'] == 6
+    assert (report['trees_added'], report['trees_retired']) == (3, 2)
+    assert model.n_estimators == len(model.estimators_) == 6
+    # The three surviving original trees come first, in their original order
+    for kept, old in zip(model.estimators_[:3], original.estimators_[2:]):
+        np.testing.assert_array_equal(kept.tree_.threshold, old.tree_.threshold)
+    assert len(load_model(model_path).estimators_) == 6
+    # The served model is not modified in place
+    assert len(original.estimators_) == 5
+
+
+def test_rejected_update_leaves_the_model_file_untouched(model_path):
+    with open(model_path, 'rb') as file:
+        before = file.read()
+    X, y = _patients(200, seed=2)
+
+    model, report = update_model(X, y, n_new_trees=3, max_score_drop=-1.0, path=model_path, random_state=0)
+
+    assert not report['published'] and report['n_estimators'] == 5
+    assert model is load_model(model_path)
+    with open(model_path, 'rb') as file:
+        assert file.read() == before
+
+
+def test_update_model_rejects_invalid_inputs(model_path):
+    X, y = _patients(50, seed=3)
+
+    with pytest.raises(ValueError, match="every outcome class"):
+        update_model(X, np.zeros(len(X), dtype=int), X_holdout=X, y_holdout=y, path=model_path)
+    with pytest.raises(ValueError, match="given together"):
+        update_model(X, y, X_holdout=X, path=model_path)
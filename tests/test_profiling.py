@@ -0,0 +1,52 @@
+import importlib
+import re
+import threading
+import pytest
+
+
+@pytest.fixture
+def profiling(tmp_path, monkeypatch):
+    monkeypatch.setenv('HEART_PROFILE', '1')
+    monkeypatch.setenv('HEART_PROFILE_DIR', str(tmp_path))
+    import profiling
+    yield importlib.reload(profiling)
+    monkeypatch.delenv('HEART_PROFILE')
+    importlib.reload(profiling)
+
+
+def _peak_growth(directory, label):
+    (report,) = directory.glob(f"*-{label}.txt")
+    match = re.search(r"Peak memory growth: ([\d.]+) KiB", report.read_text())
+    return float(match.group(1))
+
+
+def test_nested_profile_keeps_outer_peak(profiling, tmp_path):
+    with profiling.profile_render("outer"):
+        blocks = [bytearray(1024 * 1024) for _ in range(20)]
+        del blocks
+        with profiling.profile_render("inner"):
+            small = bytearray(64 * 1024)
+            del small
+
+    assert _peak_growth(tmp_path, "outer") >= 20 * 1024
+    assert _peak_growth(tmp_path, "inner") < 1024
+
+
+def test_concurrent_profile_does_not_reset_peak(profiling, tmp_path):
+    entered = threading.Event()
+
+    def other_session():
+        with profiling.profile_render("other"):
+            entered.set()
+
+    with profiling.profile_render("outer"):
+        blocks = [bytearray(1024 * 1024) for _ in range(20)]
+        del blocks
+        thread = threading.Thread(target=other_session)
+        thread.start()
+        # The other session must not start (and reset the peak) inside this render
+        assert not entered.wait(0.2)
+    thread.join()
+
+    assert _peak_growth(tmp_path, "outer") >= 20 * 1024
+    assert entered.is_set()
@@ -0,0 +1,32 @@
+from diet_recommendations import get_diet_recommendations
+from report_generator import _cached_report, generate_report
+
+USER_DATA = {
+    'name': 'Sam',
+    'age': 50,
+    'gender': 'Male',
+    'blood_pressure': 130,
+    'cholesterol': 220,
+    'chest_pain_type': 1,
+}
+
+
+def test_identical_reports_are_cached():
+    _cached_report.cache_clear()
+    recommendations = get_diet_recommendations(True)
+
+    first = generate_report(USER_DATA, True, recommendations)
+    second = generate_report(dict(USER_DATA), True, recommendations)
+
+    assert first is second
+    assert first.startswith(b"%PDF")
+
+
+def test_use_cache_false_builds_a_fresh_report():
+    _cached_report.cache_clear()
+    recommendations = get_diet_recommendations(False)
+
+    report = generate_report(USER_DATA, False, recommendations, use_cache=False)
+
+    assert report.startswith(b"%PDF")
+    assert _cached_report.cache_info().currsize == 0
@@ -0,0 +1,84 @@
+import threading
+import pytest
+from report_queue import DONE, FAILED, QueueFullError, ReportJobQueue
+
+
+class _Interrupted(BaseException):
+    pass
+
+
+def _interrupt():
+    raise _Interrupted()
+
+
+def _fail():
+    raise ValueError("no fonts")
+
+
+def test_pending_jobs_are_bounded():
+    queue = ReportJobQueue(max_workers=1, max_pending=2)
+    release = threading.Event()
+    jobs = [queue.submit(release.wait, 5) for _ in range(2)]
+
+    with pytest.raises(QueueFullError):
+        queue.submit(release.wait, 5)
+
+    release.set()
+    assert [queue.wait(job_id, timeout=5)['status'] for job_id in jobs] == [DONE, DONE]
+    # Finished jobs free their slots
+    assert queue.wait(queue.submit(bytes, 1), timeout=5)['status'] == DONE
+
+
+def test_failed_and_interrupted_jobs_release_their_slots():
+    queue = ReportJobQueue(max_workers=1, max_pending=1)
+
+    failed = queue.wait(queue.submit(_fail), timeout=5)
+    interrupted = queue.wait(queue.submit(_interrupt), timeout=5)
+
+    assert failed['status'] == FAILED and failed['error'] == "no fonts"
+    assert interrupted['status'] == FAILED
+    stats = queue.stats()
+    assert (stats['queued'], stats['running'], stats['completed'], stats['failed']) == (0, 0, 0, 2)
+    assert queue.wait(queue.submit(bytes, 1), timeout=5)['status'] == DONE
+
+
+def test_oldest_finished_jobs_are_evicted():
+    queue = ReportJobQueue(max_workers=1, max_finished=1)
+    first = queue.submit(bytes, 1)
+    queue.wait(first, timeout=5)
+    second = queue.submit(bytes, 2)
+    queue.wait(second, timeout=5)
+
+    third = queue.submit(bytes, 3)
+
+    assert queue.status(first) is None
+    assert queue.snapshot(second)['result'] == b"\x00\x00"
+    assert queue.wait(third, timeout=5)['status'] == DONE
+
+
+def test_discard_only_drops_finished_jobs():
+    queue = ReportJobQueue(max_workers=1)
+    release = threading.Event()
+    running = queue.submit(release.wait, 5)
+
+    queue.discard(running)
+    assert queue.status(running) is not None
+
+    release.set()
+    queue.wait(running, timeout=5)
+    queue.discard(running)
+    assert queue.status(running) is None
+    assert queue.snapshot(running) is None
+
+
+def test_stats_report_counts_and_latency():
+    queue = ReportJobQueue(max_workers=2)
+    assert queue.stats()['latency_p50'] is None
+
+    for job_id in [queue.submit(bytes, 1) for _ in range(3)] + [queue.submit(_fail)]:
+        queue.wait(job_id, timeout=5)
+
+    stats = queue.stats()
+    assert (stats['queued'], stats['running'], stats['completed'], stats['failed']) == (0, 0, 3, 1)
+    assert 0 <= stats['latency_p50'] <= stats['latency_p95']
+    assert stats['latency_avg'] >= 0
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from validation import FEATURE_COLUMNS, validate_batch, validate_record
+
+
+def _columns(**overrides):
+    columns = {
+        'age': [40, 55],
+        'gender': ['Male', 'Female'],
+        'blood_pressure': [120, 140],
+        'cholesterol': [200, 250],
+        'chest_pain_type': ['Typical Angina (1)', 3],
+    }
+    columns.update(overrides)
+    return columns
+
+
+def test_valid_batch_is_encoded_in_feature_order():
+    result = validate_batch(_columns())
+
+    assert result.valid.tolist() == [True, True]
+    assert result.errors == []
+    expected = [[40, 1, 1, 120, 200], [55, 0, 3, 140, 250]]
+    np.testing.assert_array_equal(result.features, np.array(expected, dtype=float))
+    assert len(FEATURE_COLUMNS) == result.features.shape[1]
+
+
+def test_dataframe_input_with_invalid_rows():
+    frame = pd.DataFrame(_columns(age=[40.0, 5.0]))
+
+    result = validate_batch(frame)
+
+    assert result.valid.tolist() == [True, False]
+    assert result.errors == [(1, 'age', "must be between 18 and 100")]
+    # The caller's frame is left untouched
+    assert frame['age'].tolist() == [40.0, 5.0]
+
+
+def test_read_only_input_is_not_written_to():
+    blood_pressure = np.array([120.0, 999.0])
+    blood_pressure.flags.writeable = False
+
+    result = validate_batch(_columns(blood_pressure=blood_pressure))
+
+    assert result.valid.tolist() == [True, False]
+    assert np.isnan(result.features[1, FEATURE_COLUMNS.index('trestbps')])
+    np.testing.assert_array_equal(blood_pressure, [120.0, 999.0])
+
+
+def test_caller_array_is_not_modified():
+    cholesterol = np.array([200.0, 250.5])
+
+    validate_batch(_columns(cholesterol=cholesterol))
+
+    np.testing.assert_array_equal(cholesterol, [200.0, 250.5])
+
+
+def test_error_report_lists_every_failed_check_per_row():
+    result = validate_batch(_columns(
+        name=['Sam', '  '],
+        age=['abc', 30],
+        gender=['Male', 'Unknown'],
+        chest_pain_type=[7, 'No Pain (0)'],
+    ))
+
+    assert result.valid.tolist() == [False, False]
+    assert sorted(result.errors_for_row(0)) == [
+        ('age', "must be a number"),
+        ('chest_pain_type', "must be a type between 0 and 3"),
+    ]
+    assert sorted(result.errors_for_row(1)) == [
+        ('gender', "must be 'Male' or 'Female'"),
+        ('name', "is required"),
+    ]
+    assert result.n_valid == 0
+
+
+def test_validate_record_normalizes_form_values():
+    user_data, errors = validate_record({
+        'name': ' Sam ',
+        'age': 60,
+        'gender': 'Female',
+        'blood_pressure': 130,
+        'cholesterol': 220,
+        'chest_pain_type': 'Non-anginal Pain (3)',
+    })
+
+    assert errors == []
+    assert user_data == {
+        'name': 'Sam',
+        'age': 60,
+        'gender': 'Female',
+        'blood_pressure': 130,
+        'cholesterol': 220,
+        'chest_pain_type': 3,
+    }
+
+
+def test_validate_record_reports_readable_errors():
+    user_data, errors = validate_record({
+        'name': 'Sam',
+        'age': 10,
+        'gender': 'Male',
+        'blood_pressure': 120,
+        'cholesterol': 200,
+        'chest_pain_type': 1,
+    })
+
+    assert user_data is None
+    assert errors == ["Age must be between 18 and 100."]
+
+
+def test_missing_names_are_required():
+    result = validate_batch(_columns(name=[None, np.nan]))
+
+    assert result.errors == [(0, 'name', "is required"), (1, 'name', "is required")]
+
+    user_data, errors = validate_record({
+        'name': None,
+        'age': 60,
+        'gender': 'Female',
+        'blood_pressure': 130,
+        'cholesterol': 220,
+        'chest_pain_type': 3,
+    })
+    assert user_data is None
+    assert errors == ["Name is required."]
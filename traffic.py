@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from diet_recommendations import get_diet_recommendations
+from model import predict_heart_disease
+from report_generator import generate_report
+from report_queue import get_report_queue, QueueFullError, FAILED
+from validation import validate_record
+
+# Recording is opt-in: set HEART_TRAFFIC_LOG to the JSONL file events should be appended to
+TRAFFIC_LOG = os.environ.get('HEART_TRAFFIC_LOG')
+
+# Stand-in for the user's name, which is never written to the log
+REPLAY_NAME = "Replay User"
+
+_log_lock = threading.Lock()
+
+
+def record_event(action, session_id=None, **data):
+    """
+    Append one app event to the traffic log. Does nothing unless HEART_TRAFFIC_LOG is set.
+
+    Args:
+        action (str): 'submit', 'navigate' or 'report'
+        session_id (str): Session the event belongs to
+        **data: JSON-serializable event details
+    """
+    if not TRAFFIC_LOG:
+        return
+    # Keep personal names out of the log
+    data = {
+        key: {k: v for k, v in value.items() if k != 'name'} if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+    line = json.dumps({'ts': time.time(), 'session_id': session_id, 'action': action, **data}, default=str)
+    with _log_lock:
+        with open(TRAFFIC_LOG, 'a') as file:
+            file.write(line + "\n")
+
+
+def load_events(path):
+    """
+    Read a traffic log, ordered by timestamp.
+    """
+    with open(path) as file:
+        events = [json.loads(line) for line in file if line.strip()]
+    return sorted(events, key=lambda event: event['ts'])
+
+
+def _anonymous(user_data):
+    return {**user_data, 'name': REPLAY_NAME}
+
+
+def run_event(event):
+    """
+    Drive one recorded event through the same code paths the app uses.
+
+    Returns:
+        bool: False if the event does not exercise any backend path (plain navigation)
+
+    Raises:
+        QueueFullError: If the report queue turned the report away, as the app would
+    """
+    action = event['action']
+    if action == 'submit':
+        user_data, errors = validate_record(_anonymous(event['form']))
+        if not errors:
+            predict_heart_disease(user_data)
+    elif action == 'navigate' and event['page'] == 'diet':
+        get_diet_recommendations(event['prediction'])
+    elif action == 'report':
+        # Go through the app's report queue so replay sees the same capped worker pool
+        # and queue wait. Every replayed report carries the same stand-in name, so bypass
+        # the PDF cache to measure real report builds rather than cache lookups
+        report_queue = get_report_queue()
+        job_id = report_queue.submit(
+            generate_report,
+            _anonymous(event['user_data']),
+            event['prediction'],
+            get_diet_recommendations(event['prediction']),
+            use_cache=False,
+            session_id=event.get('session_id')
+        )
+        status = report_queue.wait(job_id)
+        report_queue.discard(job_id)
+        if status['status'] == FAILED:
+            raise RuntimeError(f"Report generation failed: {status['error']}")
+    else:
+        return False
+    return True
+
+
+def _timed_run(event, scheduled_at):
+    started = time.perf_counter()
+    try:
+        exercised = run_event(event)
+    except QueueFullError:
+        # Counted separately: the app shows an error instead of building the report
+        exercised = None
+    finished = time.perf_counter()
+    return event['action'], exercised, finished - started, finished - scheduled_at
+
+
+def replay(events, speed=1.0, concurrency=4):
+    """
+    Replay recorded events and measure latency and throughput.
+
+    Args:
+        events (list): Events as returned by `load_events`
+        speed (float): Time compression factor (1.0 keeps the recorded pacing,
+            10.0 replays ten times faster); None replays as fast as possible
+        concurrency (int): Number of events processed in parallel
+
+    Returns:
+        dict: Throughput, per-action latency percentiles (service time and time
+        since the event was due, in seconds), the number of skipped events and the
+        number of reports turned away by a full report queue
+    """
+    if not events:
+        raise ValueError("No events to replay")
+    origin = events[0]['ts']
+    futures = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for event in events:
+            scheduled_at = start
+            if speed:
+                scheduled_at += (event['ts'] - origin) / speed
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(_timed_run, event, scheduled_at))
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    by_action = {}
+    skipped = 0
+    rejected = 0
+    for action, exercised, service_time, response_time in results:
+        if exercised is None:
+            rejected += 1
+            continue
+        if not exercised:
+            skipped += 1
+            continue
+        by_action.setdefault(action, ([], []))
+        by_action[action][0].append(service_time)
+        by_action[action][1].append(response_time)
+
+    latencies = {}
+    for action, (service_times, response_times) in sorted(by_action.items()):
+        service_p50, service_p95, service_p99 = np.percentile(service_times, [50, 95, 99])
+        response_p50, response_p95, response_p99 = np.percentile(response_times, [50, 95, 99])
+        latencies[action] = {
+            'count': len(service_times),
+            'service_p50': service_p50, 'service_p95': service_p95, 'service_p99': service_p99,
+            'response_p50': response_p50, 'response_p95': response_p95, 'response_p99': response_p99,
+        }
+
+    return {
+        'events': len(results),
+        'skipped': skipped,
+        'rejected': rejected,
+        'elapsed': elapsed,
+        'throughput': len(results) / elapsed if elapsed else float('inf'),
+        'latency': latencies,
+    }
+
+
+def _parse_speed(text):
+    return None if text == 'max' else float(text.rstrip('x'))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded app traffic and report latency and throughput.")
+    parser.add_argument('log', help="JSONL traffic log written with HEART_TRAFFIC_LOG")
+    parser.add_argument('--speed', type=_parse_speed, default=1.0, help="replay speed: 1, 10 or max")
+    parser.add_argument('--concurrency', type=int, default=4, help="events processed in parallel")
+    args = parser.parse_args()
+
+    summary = replay(load_events(args.log), speed=args.speed, concurrency=args.concurrency)
+    print(f"Replayed {summary['events']} events in {summary['elapsed']:.2f}s "
+          f"({summary['throughput']:.1f} events/s, {summary['skipped']} navigation-only, "
+          f"{summary['rejected']} reports rejected by a full queue)")
+    for action, stats in summary['latency'].items():
+        print(f"  {action:<8} n={stats['count']:<6} "
+              f"service p50/p95/p99 = {stats['service_p50'] * 1000:.1f}/{stats['service_p95'] * 1000:.1f}/{stats['service_p99'] * 1000:.1f} ms  "
+              f"response p50/p95/p99 = {stats['response_p50'] * 1000:.1f}/{stats['response_p95'] * 1000:.1f}/{stats['response_p99'] * 1000:.1f} ms")
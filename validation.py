@@ -0,0 +1,221 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Model feature order, matching the columns used in model.train_model
+FEATURE_COLUMNS = ['age', 'sex', 'cp', 'trestbps', 'chol']
+
+# Valid (inclusive) ranges for the numeric inputs, matching the home-page form
+NUMERIC_RANGES = {
+    'age': (18, 100),
+    'blood_pressure': (90, 200),
+    'cholesterol': (100, 500),
+}
+
+# Position of each numeric input in the feature array
+_NUMERIC_COLUMNS = {
+    'age': FEATURE_COLUMNS.index('age'),
+    'blood_pressure': FEATURE_COLUMNS.index('trestbps'),
+    'cholesterol': FEATURE_COLUMNS.index('chol'),
+}
+
+# Accepted gender labels and their model encoding
+GENDER_CODES = {
+    'male': 1,
+    'm': 1,
+    'female': 0,
+    'f': 0,
+}
+
+# Chest pain types shown in the form, keyed by model encoding
+CHEST_PAIN_TYPES = {
+    0: "No Pain",
+    1: "Typical Angina",
+    2: "Atypical Angina",
+    3: "Non-anginal Pain",
+}
+
+_CHEST_PAIN_LABEL = re.compile(r"\((\d+)\)\s*$")
+
+
+class ValidationResult:
+    """
+    Outcome of validating a batch of patient records.
+
+    Attributes:
+        features (numpy.ndarray): (n_rows, 5) float array in FEATURE_COLUMNS order;
+            rows that failed validation contain NaN in the offending columns
+        valid (numpy.ndarray): Boolean mask of rows that passed every check
+        errors (list): (row, field, message) tuples for every failed check
+    """
+
+    def __init__(self, features, valid, errors):
+        self.features = features
+        self.valid = valid
+        self.errors = errors
+
+    @property
+    def n_valid(self):
+        return int(self.valid.sum())
+
+    def valid_features(self):
+        """
+        Return only the rows that passed validation.
+        """
+        return self.features[self.valid]
+
+    def errors_for_row(self, row):
+        return [(field, message) for r, field, message in self.errors if r == row]
+
+
+def _to_float(values):
+    # Always a private copy: invalid entries are overwritten with NaN later on, which must
+    # not touch the caller's array (or fail on read-only views such as pandas columns).
+    # Fast path for numeric input; fall back to per-element parsing for mixed/str data
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def _encode_categorical(values, parse):
+    """
+    Encode a categorical column by parsing each distinct value once.
+
+    Args:
+        values (array-like): Raw column values
+        parse (callable): Maps a raw value to its integer code, or NaN if invalid
+
+    Returns:
+        numpy.ndarray: Float codes with NaN for unparseable values
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        uniques, inverse = np.unique(values, return_inverse=True)
+    else:
+        # Mixed object columns cannot be sorted, so compare them as strings
+        uniques, inverse = np.unique(values.astype(str), return_inverse=True)
+    codes = np.array([parse(u) for u in uniques.tolist()] or [None], dtype=np.float64)
+    return codes[inverse.reshape(-1)]
+
+
+def _parse_gender(value):
+    code = GENDER_CODES.get(str(value).strip().lower())
+    return np.nan if code is None else code
+
+
+def _parse_chest_pain(value):
+    # Accepts model codes (0-3) as well as the form labels, e.g. "Typical Angina (1)"
+    text = str(value).strip()
+    match = _CHEST_PAIN_LABEL.search(text)
+    if match:
+        text = match.group(1)
+    try:
+        code = float(text)
+    except ValueError:
+        return np.nan
+    return code if code in CHEST_PAIN_TYPES else np.nan
+
+
+def validate_batch(columns):
+    """
+    Validate and normalize a batch of patient records column by column.
+
+    Args:
+        columns (dict): Mapping of field name to array-like column with the keys
+            'age', 'gender', 'blood_pressure', 'cholesterol', 'chest_pain_type'
+            and optionally 'name'. A pandas DataFrame works as well.
+
+    Returns:
+        ValidationResult: Encoded feature array, validity mask and per-row errors
+    """
+    required = ['age', 'gender', 'blood_pressure', 'cholesterol', 'chest_pain_type']
+    missing = [field for field in required if field not in columns]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+
+    n_rows = len(columns['age'])
+    features = np.empty((n_rows, len(FEATURE_COLUMNS)), dtype=np.float64)
+    invalid = {}
+
+    for field, (low, high) in NUMERIC_RANGES.items():
+        values = _to_float(columns[field])
+        if len(values) != n_rows:
+            raise ValueError(f"Column '{field}' has {len(values)} rows, expected {n_rows}")
+        not_numeric = np.isnan(values)
+        # NaN compares False, so NaN rows are only reported as not numeric
+        out_of_range = ~not_numeric & ((values < low) | (values > high))
+        fractional = ~not_numeric & ~out_of_range & (values != np.floor(values))
+        invalid[field] = [
+            (not_numeric, "must be a number"),
+            (out_of_range, f"must be between {low} and {high}"),
+            (fractional, "must be a whole number"),
+        ]
+        values[out_of_range | fractional] = np.nan
+        features[:, _NUMERIC_COLUMNS[field]] = values
+
+    sex = _encode_categorical(columns['gender'], _parse_gender)
+    invalid['gender'] = [(np.isnan(sex), "must be 'Male' or 'Female'")]
+    features[:, FEATURE_COLUMNS.index('sex')] = sex
+
+    cp = _encode_categorical(columns['chest_pain_type'], _parse_chest_pain)
+    invalid['chest_pain_type'] = [(np.isnan(cp), "must be a type between 0 and 3")]
+    features[:, FEATURE_COLUMNS.index('cp')] = cp
+
+    if 'name' in columns:
+        names = np.asarray(columns['name'], dtype=object)
+        # None/NaN would otherwise be stringified to 'None'/'nan' and pass the blank check
+        missing = pd.isna(names)
+        blank = np.char.str_len(np.char.strip(names.astype(str))) == 0
+        invalid['name'] = [(missing | blank, "is required")]
+
+    valid = np.ones(n_rows, dtype=bool)
+    errors = []
+    for field, checks in invalid.items():
+        for mask, message in checks:
+            valid &= ~mask
+            errors.extend((int(row), field, message) for row in np.flatnonzero(mask))
+    errors.sort(key=lambda error: error[0])
+
+    return ValidationResult(features, valid, errors)
+
+
+def validate_record(record):
+    """
+    Validate a single form submission.
+
+    Args:
+        record (dict): Raw form values with the same keys as `validate_batch`
+
+    Returns:
+        tuple: (normalized user data dict or None, list of error messages)
+    """
+    result = validate_batch({field: [value] for field, value in record.items()})
+    if not result.valid[0]:
+        labels = {
+            'name': "Name",
+            'age': "Age",
+            'gender': "Gender",
+            'blood_pressure': "Blood pressure",
+            'cholesterol': "Cholesterol",
+            'chest_pain_type': "Chest pain type",
+        }
+        return None, [f"{labels[field]} {message}." for field, message in result.errors_for_row(0)]
+
+    age, sex, cp, trestbps, chol = result.features[0]
+    user_data = {
+        'age': int(age),
+        'gender': 'Male' if sex == 1 else 'Female',
+        'blood_pressure': int(trestbps),
+        'cholesterol': int(chol),
+        'chest_pain_type': int(cp),
+    }
+    if 'name' in record:
+        user_data = {'name': str(record['name']).strip(), **user_data}
+    return user_data, []